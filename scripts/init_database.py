@@ -4,11 +4,12 @@ Database Initialization Script
 Script d'initialisation de la base de données avec Alembic
 """
 
+import logging
 from pathlib import Path
-import random
-import subprocess
 import sys
 
+import numpy as np
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -16,29 +17,32 @@ sys.path.insert(0, str(project_root))
 from src.auth.auth_service import AuthService
 from src.database.db_manager import DatabaseManager
 
+# Step progress goes through logging (level-gated, one handler); the banner
+# and final summary in main() stay on stdout
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
 
 def run_alembic_upgrade():
     """Exécuter les migrations Alembic"""
     try:
-        print("🔄 Running Alembic migrations...")
-        result = subprocess.run(
-            ["alembic", "upgrade", "head"],
-            check=False,
-            cwd=Path(__file__).parent.parent,
-            capture_output=True,
-            text=True,
-        )
+        logger.info("🔄 Running Alembic migrations...")
+        # Alembic runs in this process (no second interpreter start-up). It is
+        # an optional dependency, not in the requirements: imported here so
+        # the other steps work without it installed
+        from alembic import command  # noqa: PLC0415
+        from alembic.config import Config  # noqa: PLC0415
 
-        if result.returncode == 0:
-            print("✅ Alembic migrations completed successfully")
-            print(result.stdout)
-        else:
-            print("❌ Alembic migrations failed")
-            print(result.stderr)
-            return False
+        config = Config(str(project_root / "alembic.ini"))
+        config.set_main_option("script_location", str(project_root / "alembic"))
+        command.upgrade(config, "head")
+
+        logger.info("✅ Alembic migrations completed successfully")
 
     except Exception as e:
-        print(f"❌ Error running Alembic: {e}")
+        logger.error(f"❌ Error running Alembic: {e}")
         return False
 
     return True
@@ -47,31 +51,31 @@ def run_alembic_upgrade():
 def initialize_auth_system():
     """Initialiser le système d'authentification"""
     try:
-        print("🔐 Initializing authentication system...")
+        logger.info("🔐 Initializing authentication system...")
         AuthService()
-        print("✅ Authentication system initialized")
+        logger.info("✅ Authentication system initialized")
         return True
     except Exception as e:
-        print(f"❌ Error initializing auth system: {e}")
+        logger.error(f"❌ Error initializing auth system: {e}")
         return False
 
 
 def initialize_database_manager():
     """Initialiser le gestionnaire de base de données"""
     try:
-        print("📊 Initializing database manager...")
+        logger.info("📊 Initializing database manager...")
         DatabaseManager()
-        print("✅ Database manager initialized")
+        logger.info("✅ Database manager initialized")
         return True
     except Exception as e:
-        print(f"❌ Error initializing database manager: {e}")
+        logger.error(f"❌ Error initializing database manager: {e}")
         return False
 
 
 def create_sample_data():
     """Créer des données d'exemple"""
     try:
-        print("📝 Creating sample data...")
+        logger.info("📝 Creating sample data...")
 
         # Créer un dataset d'exemple
         db_manager = DatabaseManager()
@@ -82,14 +86,18 @@ def create_sample_data():
         samples_count = 100
         hour_generated = 12
 
-        # Générer des données synthétiques
-        features_targets = []
-        for _ in range(samples_count):
-            x1 = random.uniform(-2, 2)
-            x2 = random.uniform(-2, 2)
-            # Simple classification: positive if x1 + x2 > 0
-            target = 1 if x1 + x2 > 0 else 0
-            features_targets.append((x1, x2, target))
+        # Générer des données synthétiques (un seul tirage vectorisé)
+        features = np.random.default_rng().uniform(-2, 2, size=(samples_count, 2))
+        # Simple classification: positive if x1 + x2 > 0
+        targets = (features.sum(axis=1) > 0).astype(int)
+        features_targets = list(
+            zip(
+                features[:, 0].tolist(),
+                features[:, 1].tolist(),
+                targets.tolist(),
+                strict=True,
+            )
+        )
 
         success = db_manager.store_dataset(
             generation_id=generation_id,
@@ -99,12 +107,12 @@ def create_sample_data():
         )
 
         if success:
-            print(f"✅ Sample dataset created with {samples_count} samples")
+            logger.info(f"✅ Sample dataset created with {samples_count} samples")
         else:
-            print("❌ Failed to create sample dataset")
+            logger.error("❌ Failed to create sample dataset")
 
     except Exception as e:
-        print(f"❌ Error creating sample data: {e}")
+        logger.error(f"❌ Error creating sample data: {e}")
         return False
 
     return True
@@ -4,8 +4,10 @@ Configuration settings for IA Continu Solution
 Centralized configuration management
 """
 
+from functools import lru_cache
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 
@@ -18,11 +20,6 @@ DATA_DIR = BASE_DIR / "data"
 MODELS_DIR = BASE_DIR / "models"
 LOGS_DIR = BASE_DIR / "logs"
 
-# Ensure directories exist
-DATA_DIR.mkdir(exist_ok=True)
-MODELS_DIR.mkdir(exist_ok=True)
-LOGS_DIR.mkdir(exist_ok=True)
-
 # API Configuration
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
 API_PORT = int(os.getenv("API_PORT", "9000"))
@@ -64,9 +61,16 @@ ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 DEBUG = ENVIRONMENT == "development"
 
 
+def ensure_dirs():
+    """Create the data, models and logs directories if they are missing"""
+    for directory in (DATA_DIR, MODELS_DIR, LOGS_DIR):
+        directory.mkdir(exist_ok=True)
+
+
+@lru_cache(maxsize=1)
 def get_config():
-    """Get configuration dictionary"""
-    return {
+    """Get configuration mapping (built once, read-only views shared by callers)"""
+    config = {
         "api": {
             "host": API_HOST,
             "port": API_PORT,
@@ -97,6 +101,14 @@ def get_config():
         "logging": {"level": LOG_LEVEL, "format": LOG_FORMAT},
         "environment": ENVIRONMENT,
     }
+    # The cached mapping is shared: read-only proxies stop one caller from
+    # changing the configuration seen by every other
+    return MappingProxyType(
+        {
+            key: MappingProxyType(value) if isinstance(value, dict) else value
+            for key, value in config.items()
+        }
+    )
 
 
 def print_config():
@@ -118,4 +130,5 @@ def print_config():
 
 
 if __name__ == "__main__":
+    ensure_dirs()
     print_config()
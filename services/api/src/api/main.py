@@ -4,6 +4,7 @@ IA Continu Solution - Main API Service
 FastAPI application with ML pipeline endpoints, MLflow integration, and Discord notifications
 """
 
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 import logging
 import os
@@ -13,12 +14,12 @@ import sqlite3
 import time
 
 from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import PlainTextResponse
 import joblib
 import numpy as np
-from pydantic import BaseModel, Field
-import requests
+from pydantic import BaseModel, Field, conlist
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score
 
@@ -37,6 +38,7 @@ from src.auth.auth_service import (
 from src.database.prediction_logger import get_prediction_logger
 
 # Import monitoring
+from src.monitoring.discord_notifier import DiscordNotifier
 from src.monitoring.prometheus_metrics import get_prometheus_metrics
 
 # Import advanced logging
@@ -56,11 +58,28 @@ try:
 except Exception:
     app_logger = None
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the schema and load the model once per process at startup"""
+    # Schema creation runs here rather than at import, so importing the
+    # module (tests, tooling, worker spawn) does not touch the database
+    await run_in_threadpool(init_database)
+    await run_in_threadpool(get_prediction_logger)
+
+    if current_model is None:
+        await run_in_threadpool(train_default_model)
+    yield
+
+    get_prediction_logger().close()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="IA Continu Solution - Day 3",
     description="ML API with monitoring, CI/CD, and advanced features",
     version="3.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -75,9 +94,6 @@ app.add_middleware(
 # Prometheus metrics instance
 metrics = get_prometheus_metrics()
 
-# Prediction logger instance
-pred_logger = get_prediction_logger()
-
 
 # Middleware pour les métriques
 @app.middleware("http")
@@ -114,56 +130,16 @@ data_dir.mkdir(exist_ok=True)
 # Database setup
 DATABASE_PATH = "data/ia_continu_solution.db"
 
-# Discord webhook configuration
-DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
+# Row layout of dataset_samples when streamed straight into a NumPy array
+SAMPLE_DTYPE = np.dtype([("feature1", float), ("feature2", float), ("target", int)])
+
+# Discord notifications (shared implementation in src.monitoring)
+discord_notifier = DiscordNotifier()
 
 
 def send_discord_notification(message: str, status: str = "Succès") -> bool:
     """Send notification to Discord webhook with Day 1 format"""
-    if not DISCORD_WEBHOOK_URL:
-        logger.info(f"Discord webhook not configured. Message: {message}")
-        return False
-
-    # Color mapping
-    color_map = {
-        "Succès": 5814783,  # Green
-        "Échec": 15158332,  # Red
-        "Avertissement": 16776960,  # Yellow
-        "Info": 3447003,  # Blue
-    }
-
-    color = color_map.get(status, 3447003)
-
-    data = {
-        "embeds": [
-            {
-                "title": "Résultats du pipeline",
-                "description": message,
-                "color": color,
-                "fields": [
-                    {"name": "Status", "value": status, "inline": True},
-                    {
-                        "name": "Timestamp",
-                        "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
-                        "inline": True,
-                    },
-                ],
-                "footer": {"text": "IA Continu Solution - Day 2"},
-            }
-        ]
-    }
-
-    try:
-        response = requests.post(DISCORD_WEBHOOK_URL, json=data, timeout=10)
-        if response.status_code == 204:
-            logger.info(f"✅ Discord notification sent: {message}")
-            return True
-        else:
-            logger.warning(f"❌ Discord notification failed: {response.status_code}")
-            return False
-    except Exception as e:
-        logger.error(f"❌ Discord notification error: {e}")
-        return False
+    return discord_notifier.send_notification(message, status)
 
 
 def get_db_connection():
@@ -205,6 +181,17 @@ def init_database():
             )
         """)
 
+        # Index the lookups behind "latest dataset" queries: newest dataset
+        # by created_at, then its samples by generation_id
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_datasets_created_at
+            ON datasets (created_at)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_dataset_samples_generation_id
+            ON dataset_samples (generation_id)
+        """)
+
         # Create models table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS models (
@@ -226,10 +213,6 @@ def init_database():
         return False
 
 
-# Initialize database on startup
-init_database()
-
-
 # Pydantic models
 class GenerateRequest(BaseModel):
     samples: int = Field(default=1000, ge=100, le=10000)
@@ -252,6 +235,23 @@ class PredictResponse(BaseModel):
     timestamp: str
 
 
+class PredictBatchRequest(BaseModel):
+    features: list[conlist(float, min_length=2, max_length=2)] = Field(
+        ..., min_length=1, max_length=1000
+    )
+
+
+class PredictBatchResponse(BaseModel):
+    predictions: list[PredictResponse]
+    count: int
+
+
+class HealthResponse(BaseModel):
+    status: str
+    timestamp: str
+    version: str
+
+
 # REMOVED: Retrain-related models - Day 4 Professional Architecture
 # All retraining is now handled by Prefect automation workflows
 
@@ -399,7 +399,9 @@ def get_prediction_history(
     limit: int = 100, current_user: User = Depends(get_current_user)
 ):
     """Obtenir l'historique des prédictions de l'utilisateur"""
-    history = pred_logger.get_prediction_history(limit=limit, user_id=current_user.id)
+    history = get_prediction_logger().get_prediction_history(
+        limit=limit, user_id=current_user.id
+    )
     return {"predictions": history, "total": len(history)}
 
 
@@ -408,14 +410,14 @@ def get_all_prediction_history(
     limit: int = 100, current_user: User = Depends(get_admin_user)
 ):
     """Obtenir l'historique de toutes les prédictions (admin seulement)"""
-    history = pred_logger.get_prediction_history(limit=limit)
+    history = get_prediction_logger().get_prediction_history(limit=limit)
     return {"predictions": history, "total": len(history)}
 
 
 @app.get("/predictions/stats")
 def get_prediction_stats(current_user: User = Depends(get_current_user)):
     """Obtenir les statistiques des prédictions"""
-    stats = pred_logger.get_prediction_stats()
+    stats = get_prediction_logger().get_prediction_stats()
     return stats
 
 
@@ -424,14 +426,14 @@ def get_training_history(
     limit: int = 50, current_user: User = Depends(get_current_user)
 ):
     """Obtenir l'historique des entraînements"""
-    history = pred_logger.get_training_history(limit=limit)
+    history = get_prediction_logger().get_training_history(limit=limit)
     return {"trainings": history, "total": len(history)}
 
 
 @app.get("/drift/history")
 def get_drift_history(limit: int = 50, current_user: User = Depends(get_current_user)):
     """Obtenir l'historique des détections de dérive"""
-    history = pred_logger.get_drift_detections(limit=limit)
+    history = get_prediction_logger().get_drift_detections(limit=limit)
     return {"drift_detections": history, "total": len(history)}
 
 
@@ -443,18 +445,20 @@ def get_system_logs(
     current_user: User = Depends(get_admin_user),
 ):
     """Obtenir les logs système (admin seulement)"""
-    logs = pred_logger.get_system_logs(limit=limit, level=level, component=component)
+    logs = get_prediction_logger().get_system_logs(
+        limit=limit, level=level, component=component
+    )
     return {"logs": logs, "total": len(logs)}
 
 
-@app.get("/health")
+@app.get("/health", response_model=HealthResponse)
 def health_check():
     """Health check endpoint - returns 200 OK"""
-    return {
-        "status": "ok",
-        "timestamp": datetime.now(UTC).isoformat(),
-        "version": "2.0.0",
-    }
+    return HealthResponse(
+        status="ok",
+        timestamp=datetime.now(UTC).isoformat(),
+        version="2.0.0",
+    )
 
 
 @app.post("/generate", response_model=GenerateResponse)
@@ -495,15 +499,20 @@ def generate_dataset(
             (generation_id, request.samples, current_hour),
         )
 
-        # Insert samples
-        for i in range(request.samples):
-            cursor.execute(
-                """
-                INSERT INTO dataset_samples (generation_id, feature1, feature2, target)
-                VALUES (?, ?, ?, ?)
-            """,
-                (generation_id, float(feature1[i]), float(feature2[i]), int(target[i])),
-            )
+        # Insert samples in one executemany batch (tolist() yields native types)
+        cursor.executemany(
+            """
+            INSERT INTO dataset_samples (generation_id, feature1, feature2, target)
+            VALUES (?, ?, ?, ?)
+        """,
+            zip(
+                [generation_id] * request.samples,
+                feature1.tolist(),
+                feature2.tolist(),
+                target.tolist(),
+                strict=True,
+            ),
+        )
 
         conn.commit()
         conn.close()
@@ -523,6 +532,18 @@ def generate_dataset(
         raise HTTPException(status_code=500, detail=f"Dataset generation failed: {e!s}")
 
 
+def predict_with_confidence(features: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Predict labels and confidences for a 2-D feature array"""
+    # Labels come from predict_proba: one model pass instead of predict + proba
+    if hasattr(current_model, "predict_proba"):
+        probabilities = current_model.predict_proba(features)
+        predictions = current_model.classes_[probabilities.argmax(axis=1)]
+        return predictions, probabilities.max(axis=1)
+
+    predictions = current_model.predict(features)
+    return predictions, np.full(len(predictions), 0.8)  # Default confidence
+
+
 @app.post("/predict", response_model=PredictResponse)
 def predict(request: PredictRequest, current_user: User = Depends(get_current_user)):
     """Make predictions using the latest trained model"""
@@ -533,16 +554,11 @@ def predict(request: PredictRequest, current_user: User = Depends(get_current_us
             # Train a simple model if none exists
             train_default_model()
 
-        # Make prediction
-        features = np.array(request.features).reshape(1, -1)
-        prediction = current_model.predict(features)[0]
-
-        # Get prediction probability for confidence
-        if hasattr(current_model, "predict_proba"):
-            probabilities = current_model.predict_proba(features)[0]
-            confidence = float(max(probabilities))
-        else:
-            confidence = 0.8  # Default confidence
+        # Make prediction (one float64 row, one pass over the model)
+        features = np.asarray(request.features, dtype=float).reshape(1, -1)
+        predictions, confidences = predict_with_confidence(features)
+        prediction = predictions[0]
+        confidence = float(confidences[0])
 
         # Calculate response time
         response_time_ms = (time.time() - start_time) * 1000
@@ -557,7 +573,7 @@ def predict(request: PredictRequest, current_user: User = Depends(get_current_us
             )
 
         # Enregistrer dans la base de données
-        pred_logger.log_prediction(
+        get_prediction_logger().log_prediction(
             user_id=current_user.id,
             model_version=current_model_version,
             feature1=request.features[0],
@@ -582,6 +598,58 @@ def predict(request: PredictRequest, current_user: User = Depends(get_current_us
         raise HTTPException(status_code=500, detail=f"Prediction failed: {e!s}")
 
 
+@app.post("/predict/batch", response_model=PredictBatchResponse)
+def predict_batch(
+    request: PredictBatchRequest, current_user: User = Depends(get_current_user)
+):
+    """Make predictions for several feature vectors in a single call"""
+    start_time = time.time()
+
+    try:
+        if current_model is None:
+            # Train a simple model if none exists
+            train_default_model()
+
+        # One vectorized inference pass for the whole batch
+        features = np.asarray(request.features, dtype=float)
+        predictions, confidences = predict_with_confidence(features)
+
+        # Temps de réponse moyen par prédiction
+        response_time_ms = (time.time() - start_time) * 1000 / len(features)
+
+        # Enregistrer le lot dans la base de données en une seule transaction
+        get_prediction_logger().log_predictions(
+            user_id=current_user.id,
+            model_version=current_model_version,
+            rows=[
+                (f1, f2, int(pred), float(conf))
+                for (f1, f2), pred, conf in zip(
+                    request.features, predictions, confidences, strict=True
+                )
+            ],
+            response_time_ms=response_time_ms,
+        )
+
+        metrics.record_prediction(current_model_version, count=len(features))
+
+        timestamp = datetime.now(UTC).isoformat()
+        results = [
+            PredictResponse(
+                prediction=int(pred),
+                model_version=current_model_version,
+                confidence=float(conf),
+                timestamp=timestamp,
+            )
+            for pred, conf in zip(predictions, confidences, strict=True)
+        ]
+
+        return PredictBatchResponse(predictions=results, count=len(results))
+
+    except Exception as e:
+        logger.error(f"Batch prediction failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch prediction failed: {e!s}")
+
+
 def train_default_model():
     """Train a default model with synthetic data"""
     global current_model, current_model_version
@@ -631,7 +699,8 @@ def evaluate_current_model_performance() -> float:
             LIMIT 200
         """)
 
-        test_samples = cursor.fetchall()
+        # Lire le curseur directement en colonnes NumPy (pas de liste de tuples)
+        test_samples = np.fromiter(cursor, dtype=SAMPLE_DTYPE)
         conn.close()
 
         if len(test_samples) < 10:
@@ -640,9 +709,9 @@ def evaluate_current_model_performance() -> float:
             )
             return 0.8  # Valeur par défaut conservatrice
 
-        # Préparer les données de test
-        X_test = np.array([[s[0], s[1]] for s in test_samples])
-        y_test = np.array([s[2] for s in test_samples])
+        # Préparer les données de test (tableau contigu, sans copie côté sklearn)
+        X_test = np.column_stack((test_samples["feature1"], test_samples["feature2"]))
+        y_test = test_samples["target"]
 
         # Faire des prédictions
         y_pred = current_model.predict(X_test)
@@ -704,4 +773,14 @@ def list_datasets():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Same knob as the uvicorn CLI (--workers defaults to $WEB_CONCURRENCY).
+    # Each worker holds its own in-memory model, so keep 1 unless retraining
+    # goes through MLflow. loop/http "auto" already pick uvloop and httptools
+    # when uvicorn[standard] is installed.
+    uvicorn.run(
+        "src.api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        log_level=os.getenv("UVICORN_LOG_LEVEL", "info"),
+    )
@@ -7,6 +7,7 @@ Handles SQLite database operations for datasets and models
 import logging
 from pathlib import Path
 import sqlite3
+import sys
 
 # Configure logging
 logging.basicConfig(
@@ -60,6 +61,17 @@ class DatabaseManager:
                 )
             """)
 
+            # Index the lookups behind "latest dataset" queries: newest dataset
+            # by created_at, then its samples by generation_id
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_datasets_created_at
+                ON datasets (created_at)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_dataset_samples_generation_id
+                ON dataset_samples (generation_id)
+            """)
+
             # Create models table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS models (
@@ -105,6 +117,7 @@ class DatabaseManager:
         try:
             conn = sqlite3.connect(self.db_path, timeout=30.0)
             conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
             cursor = conn.cursor()
 
             # Insert dataset metadata
@@ -116,15 +129,17 @@ class DatabaseManager:
                 (generation_id, samples_count, hour_generated),
             )
 
-            # Insert samples
-            for feature1, feature2, target in features_targets:
-                cursor.execute(
-                    """
-                    INSERT INTO dataset_samples (generation_id, feature1, feature2, target)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (generation_id, feature1, feature2, target),
-                )
+            # Insert samples in one executemany batch (statement prepared once)
+            cursor.executemany(
+                """
+                INSERT INTO dataset_samples (generation_id, feature1, feature2, target)
+                VALUES (?, ?, ?, ?)
+            """,
+                [
+                    (generation_id, feature1, feature2, target)
+                    for feature1, feature2, target in features_targets
+                ],
+            )
 
             conn.commit()
             conn.close()
@@ -141,30 +156,24 @@ class DatabaseManager:
             conn = sqlite3.connect(self.db_path, timeout=30.0)
             cursor = conn.cursor()
 
-            # Get latest generation_id
-            cursor.execute(
-                "SELECT generation_id FROM datasets ORDER BY created_at DESC LIMIT 1"
-            )
-            result = cursor.fetchone()
+            # Latest generation_id and its samples in a single round-trip
+            cursor.execute("""
+                SELECT d.generation_id, s.feature1, s.feature2, s.target
+                FROM (
+                    SELECT generation_id FROM datasets
+                    ORDER BY created_at DESC LIMIT 1
+                ) AS d
+                LEFT JOIN dataset_samples AS s ON s.generation_id = d.generation_id
+                ORDER BY s.id
+            """)
+            rows = cursor.fetchall()
+            conn.close()
 
-            if not result:
-                conn.close()
+            if not rows:
                 return None
 
-            generation_id = result[0]
-
-            # Get samples for this generation
-            cursor.execute(
-                """
-                SELECT feature1, feature2, target
-                FROM dataset_samples
-                WHERE generation_id = ?
-            """,
-                (generation_id,),
-            )
-
-            samples = cursor.fetchall()
-            conn.close()
+            generation_id = rows[0][0]
+            samples = [row[1:] for row in rows if row[1] is not None]
 
             return generation_id, samples
 
@@ -335,36 +344,39 @@ class DatabaseManager:
             logger.error(f"Failed to store experiment: {e}")
             return False
 
-    def get_database_stats(self) -> dict:
-        """Get database statistics"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+    def _collect_stats(self, cursor: sqlite3.Cursor) -> dict:
+        """Count rows of each table on an already open cursor"""
+        # Count datasets
+        cursor.execute("SELECT COUNT(*) FROM datasets")
+        datasets_count = cursor.fetchone()[0]
 
-            # Count datasets
-            cursor.execute("SELECT COUNT(*) FROM datasets")
-            datasets_count = cursor.fetchone()[0]
+        # Count samples
+        cursor.execute("SELECT COUNT(*) FROM dataset_samples")
+        samples_count = cursor.fetchone()[0]
 
-            # Count samples
-            cursor.execute("SELECT COUNT(*) FROM dataset_samples")
-            samples_count = cursor.fetchone()[0]
+        # Count models
+        cursor.execute("SELECT COUNT(*) FROM models")
+        models_count = cursor.fetchone()[0]
 
-            # Count models
-            cursor.execute("SELECT COUNT(*) FROM models")
-            models_count = cursor.fetchone()[0]
+        # Count experiments
+        cursor.execute("SELECT COUNT(*) FROM experiments")
+        experiments_count = cursor.fetchone()[0]
 
-            # Count experiments
-            cursor.execute("SELECT COUNT(*) FROM experiments")
-            experiments_count = cursor.fetchone()[0]
+        return {
+            "datasets": datasets_count,
+            "samples": samples_count,
+            "models": models_count,
+            "experiments": experiments_count,
+        }
 
+    def get_database_stats(self) -> dict:
+        """Get database statistics"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            stats = self._collect_stats(cursor)
             conn.close()
-
-            return {
-                "datasets": datasets_count,
-                "samples": samples_count,
-                "models": models_count,
-                "experiments": experiments_count,
-            }
+            return stats
 
         except Exception as e:
             logger.error(f"Failed to get database stats: {e}")
@@ -380,17 +392,23 @@ class DatabaseManager:
             cursor.execute("SELECT 1")
             result = cursor.fetchone()
 
+            if not result or result[0] != 1:
+                conn.close()
+                return {"status": "unhealthy", "message": "Database query failed"}
+
+            # Stats on the same connection instead of opening a second one
+            try:
+                stats = self._collect_stats(cursor)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to get database stats: {e}")
+                stats = {}
             conn.close()
 
-            if result and result[0] == 1:
-                stats = self.get_database_stats()
-                return {
-                    "status": "healthy",
-                    "message": "Database is accessible and functioning",
-                    "stats": stats,
-                }
-            else:
-                return {"status": "unhealthy", "message": "Database query failed"}
+            return {
+                "status": "healthy",
+                "message": "Database is accessible and functioning",
+                "stats": stats,
+            }
 
         except Exception as e:
             return {
@@ -399,6 +417,16 @@ class DatabaseManager:
             }
 
 
+MENU_TEXT = """\
+Choose an option:
+1. Database health check
+2. Show database statistics
+3. List datasets
+4. List models
+5. Get active model
+"""
+
+
 def main():
     """Main database manager execution"""
     print("🗄️ Database Manager")
@@ -406,12 +434,8 @@ def main():
 
     db_manager = DatabaseManager()
 
-    print("Choose an option:")
-    print("1. Database health check")
-    print("2. Show database statistics")
-    print("3. List datasets")
-    print("4. List models")
-    print("5. Get active model")
+    sys.stdout.write(MENU_TEXT)
+    sys.stdout.flush()
 
     try:
         choice = input("\nEnter choice (1-5): ").strip()
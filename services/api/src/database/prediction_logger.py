@@ -6,6 +6,7 @@ Service pour enregistrer l'historique des prédictions et métriques
 
 import json
 import sqlite3
+import threading
 from typing import Any
 
 
@@ -14,11 +15,48 @@ class PredictionLogger:
 
     def __init__(self, db_path: str = "data/ia_continu_solution.db"):
         self.db_path = db_path
+
+        # Une connexion par thread (threadpool FastAPI), réutilisée entre appels
+        self._local = threading.local()
+
+        # Toutes les connexions ouvertes, pour pouvoir les fermer à l'arrêt
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
         self.ensure_tables()
 
+        # La connexion du thread d'initialisation ne sert plus
+        self.close()
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Connexion SQLite du thread courant, ouverte au premier appel"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False uniquement pour que close() puisse la
+            # fermer depuis un autre thread ; seul son thread l'utilise
+            conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        elif conn.in_transaction:
+            # Une erreur précédente a laissé une transaction ouverte
+            conn.rollback()
+        return conn
+
+    def close(self):
+        """Fermer les connexions de tous les threads"""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            # Les threads rouvriront une connexion au prochain appel
+            self._local = threading.local()
+
     def ensure_tables(self):
         """Créer les tables de logging si elles n'existent pas"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         # Table des logs de prédictions
@@ -94,7 +132,6 @@ class PredictionLogger:
         """)
 
         conn.commit()
-        conn.close()
 
     def log_prediction(
         self,
@@ -107,7 +144,7 @@ class PredictionLogger:
         response_time_ms: float | None = None,
     ):
         """Enregistrer une prédiction"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -128,7 +165,28 @@ class PredictionLogger:
         )
 
         conn.commit()
-        conn.close()
+
+    def log_predictions(
+        self,
+        user_id: int | None,
+        model_version: str,
+        rows: list[tuple[float, float, int, float]],
+        response_time_ms: float | None = None,
+    ):
+        """Enregistrer un lot de prédictions (feature1, feature2, prediction, confidence)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.executemany(
+            """
+            INSERT INTO prediction_logs
+            (user_id, model_version, feature1, feature2, prediction, confidence, response_time_ms)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+            [(user_id, model_version, *row, response_time_ms) for row in rows],
+        )
+
+        conn.commit()
 
     def log_training(
         self,
@@ -141,7 +199,7 @@ class PredictionLogger:
         mlflow_run_id: str | None = None,
     ):
         """Enregistrer un entraînement"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -163,7 +221,6 @@ class PredictionLogger:
         )
 
         conn.commit()
-        conn.close()
 
     def log_system_event(
         self,
@@ -175,7 +232,7 @@ class PredictionLogger:
         user_id: int | None = None,
     ):
         """Enregistrer un événement système"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         details_json = json.dumps(details) if details else None
@@ -190,7 +247,6 @@ class PredictionLogger:
         )
 
         conn.commit()
-        conn.close()
 
     def log_monitoring_metric(
         self,
@@ -200,7 +256,7 @@ class PredictionLogger:
         labels: dict[str, str] | None = None,
     ):
         """Enregistrer une métrique de monitoring"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         labels_json = json.dumps(labels) if labels else None
@@ -215,7 +271,6 @@ class PredictionLogger:
         )
 
         conn.commit()
-        conn.close()
 
     def log_drift_detection(
         self,
@@ -227,7 +282,7 @@ class PredictionLogger:
         details: dict[str, Any] | None = None,
     ):
         """Enregistrer une détection de dérive"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         details_json = json.dumps(details) if details else None
@@ -249,13 +304,12 @@ class PredictionLogger:
         )
 
         conn.commit()
-        conn.close()
 
     def get_prediction_history(
         self, limit: int = 100, user_id: int | None = None
     ) -> list[dict]:
         """Récupérer l'historique des prédictions"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         if user_id:
@@ -283,7 +337,6 @@ class PredictionLogger:
             )
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [
             {
@@ -302,7 +355,7 @@ class PredictionLogger:
 
     def get_training_history(self, limit: int = 50) -> list[dict]:
         """Récupérer l'historique des entraînements"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -318,7 +371,6 @@ class PredictionLogger:
         )
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [
             {
@@ -337,7 +389,7 @@ class PredictionLogger:
 
     def get_drift_detections(self, limit: int = 50) -> list[dict]:
         """Récupérer l'historique des détections de dérive"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -352,7 +404,6 @@ class PredictionLogger:
         )
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [
             {
@@ -372,7 +423,7 @@ class PredictionLogger:
         self, limit: int = 100, level: str | None = None, component: str | None = None
     ) -> list[dict]:
         """Récupérer les logs système"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         query = """
@@ -397,7 +448,6 @@ class PredictionLogger:
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
 
         return [
             {
@@ -415,7 +465,7 @@ class PredictionLogger:
 
     def get_prediction_stats(self) -> dict[str, Any]:
         """Obtenir des statistiques sur les prédictions"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         # Nombre total de prédictions
@@ -441,8 +491,6 @@ class PredictionLogger:
         )
         avg_response_time = cursor.fetchone()[0] or 0
 
-        conn.close()
-
         return {
             "total_predictions": total_predictions,
             "predictions_by_model": predictions_by_model,
@@ -451,10 +499,16 @@ class PredictionLogger:
         }
 
 
-# Instance globale
-prediction_logger = PredictionLogger()
+# Instance globale, créée au premier appel (pas d'accès base à l'import)
+_prediction_logger: PredictionLogger | None = None
+_prediction_logger_lock = threading.Lock()
 
 
 def get_prediction_logger() -> PredictionLogger:
     """Obtenir l'instance du logger de prédictions"""
-    return prediction_logger
+    global _prediction_logger
+    if _prediction_logger is None:
+        with _prediction_logger_lock:
+            if _prediction_logger is None:
+                _prediction_logger = PredictionLogger()
+    return _prediction_logger
@@ -4,13 +4,13 @@ MLflow Service Manager for IA Continu Solution
 Handles MLflow server management and experiment tracking
 """
 
+import argparse
 import logging
 from pathlib import Path
 import subprocess
+import sys
 import time
 
-import mlflow
-import mlflow.sklearn
 import requests
 
 # Configure logging
@@ -20,6 +20,28 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# mlflow is a heavy import that server start/stop and status checks don't need:
+# it is loaded on first use, later calls are a sys.modules lookup
+def import_mlflow():
+    """Import mlflow and its sklearn flavor on first use"""
+    import mlflow  # noqa: PLC0415
+    import mlflow.sklearn  # noqa: PLC0415
+
+    return mlflow
+
+
+def wait_until_ready(check_fn, process=None, timeout=30.0, interval=0.1) -> bool:
+    """Poll check_fn until it returns True, the process exits, or timeout"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if check_fn():
+            return True
+        if process is not None and process.poll() is not None:
+            return False
+        time.sleep(interval)
+    return False
+
+
 class MLflowManager:
     """MLflow service manager"""
 
@@ -37,6 +59,23 @@ class MLflowManager:
         self.mlflow_dir = Path("mlruns")
         self.mlflow_dir.mkdir(exist_ok=True)
 
+        # Loaded models keyed by name -> (version, model), reloaded on new version
+        self._model_cache = {}
+
+        # Tracking client, created on first use and reused for every REST call
+        self._client = None
+
+        # Log file receiving the output of a server started by this manager
+        self.server_log_path = self.mlflow_dir / "mlflow_server.log"
+
+    @property
+    def client(self):
+        """MLflow tracking client shared across calls"""
+        if self._client is None:
+            mlflow = import_mlflow()
+            self._client = mlflow.tracking.MlflowClient(tracking_uri=self.tracking_uri)
+        return self._client
+
     def start_mlflow_server(self, host="0.0.0.0", port=5000):
         """Start MLflow tracking server"""
         try:
@@ -61,17 +100,18 @@ class MLflowManager:
                 str(port),
             ]
 
-            self.mlflow_process = subprocess.Popen(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-            )
+            # Server output goes to a log file: nothing reads the process, and
+            # undrained pipes would block the server once their buffer fills.
+            # The child keeps its own copy of the descriptor.
+            with open(self.server_log_path, "a") as server_log:
+                self.mlflow_process = subprocess.Popen(
+                    cmd, stdout=server_log, stderr=subprocess.STDOUT
+                )
 
-            # Wait for server to start
-            max_retries = 30
-            for _i in range(max_retries):
-                if self.is_mlflow_running():
-                    logger.info("MLflow server started successfully")
-                    return True
-                time.sleep(1)
+            # Poll readiness at a short interval instead of once per second
+            if wait_until_ready(self.is_mlflow_running, self.mlflow_process):
+                logger.info("MLflow server started successfully")
+                return True
 
             logger.error("MLflow server failed to start within timeout")
             return False
@@ -102,6 +142,8 @@ class MLflowManager:
 
     def setup_experiment(self):
         """Setup MLflow experiment"""
+        mlflow = import_mlflow()
+
         try:
             mlflow.set_tracking_uri(self.tracking_uri)
 
@@ -121,6 +163,8 @@ class MLflowManager:
 
     def log_model_training(self, model, params, metrics, model_name="ia_continu_model"):
         """Log model training to MLflow"""
+        mlflow = import_mlflow()
+
         try:
             with mlflow.start_run():
                 # Log parameters
@@ -144,8 +188,10 @@ class MLflowManager:
 
     def get_latest_model(self, model_name="ia_continu_model"):
         """Get latest model from MLflow"""
+        mlflow = import_mlflow()
+
         try:
-            client = mlflow.tracking.MlflowClient(tracking_uri=self.tracking_uri)
+            client = self.client
 
             # Get latest version of the model
             latest_version = client.get_latest_versions(
@@ -154,8 +200,15 @@ class MLflowManager:
 
             if latest_version:
                 model_version = latest_version[0]
+
+                # Skip the artifact download and unpickling if unchanged
+                cached = self._model_cache.get(model_name)
+                if cached and cached[0] == model_version.version:
+                    return cached[1]
+
                 model_uri = f"models:/{model_name}/{model_version.version}"
                 model = mlflow.sklearn.load_model(model_uri)
+                self._model_cache[model_name] = (model_version.version, model)
                 logger.info(
                     f"Loaded model {model_name} version {model_version.version}"
                 )
@@ -170,8 +223,10 @@ class MLflowManager:
 
     def get_experiment_runs(self, limit=10):
         """Get recent experiment runs"""
+        mlflow = import_mlflow()
+
         try:
-            client = mlflow.tracking.MlflowClient(tracking_uri=self.tracking_uri)
+            client = self.client
             experiment = mlflow.get_experiment_by_name(self.experiment_name)
 
             if experiment:
@@ -214,6 +269,7 @@ class MLflowManager:
                 }
 
             # Check experiment setup
+            mlflow = import_mlflow()
             mlflow.set_tracking_uri(self.tracking_uri)
             experiment = mlflow.get_experiment_by_name(self.experiment_name)
 
@@ -240,63 +296,89 @@ class MLflowManager:
             }
 
 
+# Command-line commands, in interactive menu order
+COMMANDS = ("start", "stop", "status", "setup", "health")
+MENU_CHOICES = dict(zip("12345", COMMANDS, strict=True))
+MENU_TEXT = """\
+Choose an option:
+1. Start MLflow server
+2. Stop MLflow server
+3. Check MLflow status
+4. Setup experiment
+5. Health check
+"""
+
+
+def run_command(manager: MLflowManager, command: str):
+    """Run a single manager command and print its outcome"""
+    if command == "start":
+        print("\n🚀 Starting MLflow server...")
+        success = manager.start_mlflow_server()
+        if success:
+            print("✅ MLflow server started successfully")
+            print(f"   Access UI at: {manager.tracking_uri}")
+        else:
+            print("❌ Failed to start MLflow server")
+
+    elif command == "stop":
+        print("\n⏹️ Stopping MLflow server...")
+        success = manager.stop_mlflow_server()
+        if success:
+            print("✅ MLflow server stopped")
+        else:
+            print("❌ Failed to stop MLflow server")
+
+    elif command == "status":
+        print("\n🔍 Checking MLflow status...")
+        if manager.is_mlflow_running():
+            print("✅ MLflow server is running")
+        else:
+            print("❌ MLflow server is not running")
+
+    elif command == "setup":
+        print("\n⚙️ Setting up experiment...")
+        success = manager.setup_experiment()
+        if success:
+            print("✅ Experiment setup completed")
+        else:
+            print("❌ Failed to setup experiment")
+
+    elif command == "health":
+        print("\n🏥 Performing health check...")
+        health = manager.health_check()
+        print(f"Status: {health['status']}")
+        print(f"Message: {health['message']}")
+
+
 def main():
     """Main MLflow service execution"""
+    parser = argparse.ArgumentParser(description="MLflow service manager")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=COMMANDS,
+        help="run one command non-interactively (default: interactive menu)",
+    )
+    args = parser.parse_args()
+
     print("🔬 MLflow Service Manager")
     print("=" * 30)
 
     manager = MLflowManager()
 
-    print("Choose an option:")
-    print("1. Start MLflow server")
-    print("2. Stop MLflow server")
-    print("3. Check MLflow status")
-    print("4. Setup experiment")
-    print("5. Health check")
-
     try:
-        choice = input("\nEnter choice (1-5): ").strip()
-
-        if choice == "1":
-            print("\n🚀 Starting MLflow server...")
-            success = manager.start_mlflow_server()
-            if success:
-                print("✅ MLflow server started successfully")
-                print(f"   Access UI at: {manager.tracking_uri}")
-            else:
-                print("❌ Failed to start MLflow server")
+        command = args.command
+        if command is None:
+            sys.stdout.write(MENU_TEXT)
+            sys.stdout.flush()
 
-        elif choice == "2":
-            print("\n⏹️ Stopping MLflow server...")
-            success = manager.stop_mlflow_server()
-            if success:
-                print("✅ MLflow server stopped")
-            else:
-                print("❌ Failed to stop MLflow server")
-
-        elif choice == "3":
-            print("\n🔍 Checking MLflow status...")
-            if manager.is_mlflow_running():
-                print("✅ MLflow server is running")
-            else:
-                print("❌ MLflow server is not running")
+            choice = input("\nEnter choice (1-5): ").strip()
+            command = MENU_CHOICES.get(choice)
 
-        elif choice == "4":
-            print("\n⚙️ Setting up experiment...")
-            success = manager.setup_experiment()
-            if success:
-                print("✅ Experiment setup completed")
-            else:
-                print("❌ Failed to setup experiment")
-
-        elif choice == "5":
-            print("\n🏥 Performing health check...")
-            health = manager.health_check()
-            print(f"Status: {health['status']}")
-            print(f"Message: {health['message']}")
-
-        else:
+        if command is None:
             print("❌ Invalid choice")
+        else:
+            run_command(manager, command)
 
     except KeyboardInterrupt:
         print("\n\n⏹️ Operation cancelled")
@@ -4,24 +4,51 @@ Discord Notification Service for IA Continu Solution
 Handles Discord webhook notifications with proper formatting
 """
 
-from datetime import datetime
 import logging
 import os
+import sys
+import time
 
 import requests
 
+from src.utils.json_utils import encode_json
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Webhook URL read once at import, shared by every notifier instance
+DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
+
+
+# HTTP session shared by all notifiers (keep-alive connection to Discord)
+http_session = requests.Session()
+http_session.headers["Content-Type"] = "application/json"
+
+# Color mapping
+COLOR_MAP = {
+    "Succès": 5814783,  # Green
+    "Échec": 15158332,  # Red
+    "Avertissement": 16776960,  # Yellow
+    "Info": 3447003,  # Blue
+}
+DEFAULT_COLOR = COLOR_MAP["Info"]
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time formatted for embeds (C-level strftime, no datetime)"""
+    return time.strftime(TIMESTAMP_FORMAT, time.gmtime())
+
 
 class DiscordNotifier:
     """Discord webhook notification service"""
 
     def __init__(self, webhook_url: str | None = None):
-        self.webhook_url = webhook_url or os.getenv("DISCORD_WEBHOOK_URL")
+        self.webhook_url = webhook_url or DISCORD_WEBHOOK_URL
 
     def send_notification(self, message: str, status: str = "Succès") -> bool:
         """Send notification to Discord webhook with Day 1 format"""
@@ -29,15 +56,7 @@ class DiscordNotifier:
             logger.warning("Discord webhook URL not configured")
             return False
 
-        # Color mapping
-        color_map = {
-            "Succès": 5814783,  # Green
-            "Échec": 15158332,  # Red
-            "Avertissement": 16776960,  # Yellow
-            "Info": 3447003,  # Blue
-        }
-
-        color = color_map.get(status, 3447003)
+        color = COLOR_MAP.get(status, DEFAULT_COLOR)
 
         data = {
             "embeds": [
@@ -49,7 +68,7 @@ class DiscordNotifier:
                         {"name": "Status", "value": status, "inline": True},
                         {
                             "name": "Timestamp",
-                            "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                            "value": _utc_timestamp(),
                             "inline": True,
                         },
                     ],
@@ -59,7 +78,9 @@ class DiscordNotifier:
         }
 
         try:
-            response = requests.post(self.webhook_url, json=data, timeout=10)
+            response = http_session.post(
+                self.webhook_url, data=encode_json(data), timeout=10
+            )
             if response.status_code == 204:
                 logger.info(f"✅ Discord notification sent: {message}")
                 return True
@@ -135,7 +156,7 @@ def test_discord_webhook():
     print("=" * 30)
 
     # Check if webhook URL is configured
-    webhook_url = os.getenv("DISCORD_WEBHOOK_URL")
+    webhook_url = DISCORD_WEBHOOK_URL
     if not webhook_url:
         print("❌ DISCORD_WEBHOOK_URL environment variable not set")
         print("Please set it with your Discord webhook URL:")
@@ -184,14 +205,23 @@ def test_discord_webhook():
         return False
 
 
+MENU_TEXT = """
+Choose an option:
+1. Test webhook
+2. Send test notification
+3. Send success notification
+4. Send failure notification
+5. Run comprehensive test
+"""
+
+
 def main():
     """Main Discord notifier execution"""
     print("📱 Discord Notification Service")
     print("=" * 35)
 
     # Check configuration
-    webhook_url = os.getenv("DISCORD_WEBHOOK_URL")
-    if webhook_url:
+    if DISCORD_WEBHOOK_URL:
         print("✅ Discord webhook URL configured")
     else:
         print("❌ Discord webhook URL not configured")
@@ -200,12 +230,8 @@ def main():
 
     notifier = DiscordNotifier()
 
-    print("\nChoose an option:")
-    print("1. Test webhook")
-    print("2. Send test notification")
-    print("3. Send success notification")
-    print("4. Send failure notification")
-    print("5. Run comprehensive test")
+    sys.stdout.write(MENU_TEXT)
+    sys.stdout.flush()
 
     try:
         choice = input("\nEnter choice (1-5): ").strip()
@@ -160,9 +160,9 @@ class PrometheusMetrics:
         """Décrémenter le nombre de requêtes actives"""
         self.api_active_requests.dec()
 
-    def record_prediction(self, model_version: str):
-        """Enregistrer une prédiction"""
-        self.ml_predictions_total.labels(model_version=model_version).inc()
+    def record_prediction(self, model_version: str, count: int = 1):
+        """Enregistrer une ou plusieurs prédictions"""
+        self.ml_predictions_total.labels(model_version=model_version).inc(count)
 
     def update_model_accuracy(self, model_version: str, accuracy: float):
         """Mettre à jour la précision du modèle"""
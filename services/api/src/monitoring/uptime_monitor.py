@@ -4,11 +4,17 @@ Uptime Kuma Integration for IA Continu Solution
 Provides uptime monitoring and health checks integration
 """
 
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
+import signal
+import sys
+import threading
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Configure logging
 logging.basicConfig(
@@ -16,6 +22,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Endpoints probed by the comprehensive health check (read-only, shared by
+# every check instead of being rebuilt per cycle)
+ENDPOINTS_TO_CHECK = (
+    {"endpoint": "/health", "method": "GET"},
+    {"endpoint": "/", "method": "GET"},
+    {"endpoint": "/model/info", "method": "GET"},
+    {"endpoint": "/datasets/list", "method": "GET"},
+    {
+        "endpoint": "/predict",
+        "method": "POST",
+        "data": {"features": [0.5, -0.3]},
+    },
+    {"endpoint": "/generate", "method": "POST", "data": {"samples": 100}},
+)
+
 
 class UptimeMonitor:
     """Uptime monitoring service integration"""
@@ -29,11 +50,32 @@ class UptimeMonitor:
         self.uptime_kuma_url = uptime_kuma_url
         self.monitors = []
 
+        # Set to stop continuous monitoring without waiting out the interval
+        self.stop_event = threading.Event()
+
+        # Maximum number of endpoint checks in flight at once
+        self.max_concurrent_checks = 4
+
+        # Keep-alive session reused across checks and monitoring cycles, with a
+        # pool large enough for every concurrent check to keep its connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.max_concurrent_checks)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self.session.close()
+
+    def stop(self):
+        """Stop continuous monitoring at the next wait"""
+        self.stop_event.set()
+
     def check_api_health(self) -> dict:
         """Check API health status"""
         try:
             start_time = time.time()
-            response = requests.get(f"{self.api_url}/health", timeout=10)
+            response = self.session.get(f"{self.api_url}/health", timeout=10)
             response_time = time.time() - start_time
 
             if response.status_code == 200:
@@ -70,9 +112,9 @@ class UptimeMonitor:
             url = f"{self.api_url}{endpoint}"
 
             if method.upper() == "GET":
-                response = requests.get(url, timeout=10)
+                response = self.session.get(url, timeout=10)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, timeout=10)
+                response = self.session.post(url, json=data, timeout=10)
             else:
                 return {"status": "error", "message": f"Unsupported method: {method}"}
 
@@ -95,27 +137,33 @@ class UptimeMonitor:
                 "message": str(e),
             }
 
+    def _check_endpoints_concurrently(
+        self, endpoints_to_check: tuple[dict, ...]
+    ) -> list:
+        """Check endpoints concurrently, capped by max_concurrent_checks"""
+        # Plain worker threads over the pooled session: safe to call from code
+        # that already runs an event loop (FastAPI handlers, async tasks)
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_checks) as executor:
+            futures = [
+                executor.submit(
+                    self.check_endpoint_health,
+                    endpoint_config["endpoint"],
+                    endpoint_config["method"],
+                    endpoint_config.get("data"),
+                )
+                for endpoint_config in endpoints_to_check
+            ]
+
+        return [future.result() for future in futures]
+
     def run_comprehensive_health_check(self) -> dict:
         """Run comprehensive health check on all endpoints"""
         logger.info("Running comprehensive health check")
 
-        endpoints_to_check = [
-            {"endpoint": "/health", "method": "GET"},
-            {"endpoint": "/", "method": "GET"},
-            {"endpoint": "/model/info", "method": "GET"},
-            {"endpoint": "/datasets/list", "method": "GET"},
-            {
-                "endpoint": "/predict",
-                "method": "POST",
-                "data": {"features": [0.5, -0.3]},
-            },
-            {"endpoint": "/generate", "method": "POST", "data": {"samples": 100}},
-        ]
-
         results = {
             "timestamp": datetime.now().isoformat(),
             "overall_status": "up",
-            "total_endpoints": len(endpoints_to_check),
+            "total_endpoints": len(ENDPOINTS_TO_CHECK),
             "endpoints_up": 0,
             "endpoints_down": 0,
             "average_response_time": 0,
@@ -124,12 +172,9 @@ class UptimeMonitor:
 
         total_response_time = 0
 
-        for endpoint_config in endpoints_to_check:
-            endpoint = endpoint_config["endpoint"]
-            method = endpoint_config["method"]
-            data = endpoint_config.get("data")
+        endpoint_results = self._check_endpoints_concurrently(ENDPOINTS_TO_CHECK)
 
-            result = self.check_endpoint_health(endpoint, method, data)
+        for result in endpoint_results:
             results["endpoint_results"].append(result)
 
             if result["status"] == "up":
@@ -194,9 +239,11 @@ class UptimeMonitor:
                     logger.info(f"Monitoring completed after {duration} seconds")
                     break
 
-                # Wait for next cycle
+                # Wait for next cycle (returns early once stop_event is set)
                 logger.info(f"Waiting {interval} seconds until next cycle...")
-                time.sleep(interval)
+                if self.stop_event.wait(interval):
+                    logger.info("Monitoring stopped")
+                    break
 
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user")
@@ -263,12 +310,15 @@ class UptimeMonitor:
     def check_uptime_kuma_status(self) -> dict:
         """Check if Uptime Kuma is running"""
         try:
-            response = requests.get(self.uptime_kuma_url, timeout=5)
-            return {
-                "status": "running",
-                "status_code": response.status_code,
-                "url": self.uptime_kuma_url,
-            }
+            # Only the status code is reported: skip downloading the web UI
+            with self.session.get(
+                self.uptime_kuma_url, timeout=5, stream=True
+            ) as response:
+                return {
+                    "status": "running",
+                    "status_code": response.status_code,
+                    "url": self.uptime_kuma_url,
+                }
         except requests.RequestException as e:
             return {
                 "status": "not_running",
@@ -277,86 +327,121 @@ class UptimeMonitor:
             }
 
 
+# Command-line commands, in interactive menu order
+COMMANDS = ("health", "check", "monitor", "report", "kuma", "endpoint")
+MENU_CHOICES = dict(zip("123456", COMMANDS, strict=True))
+MENU_TEXT = """\
+Choose an option:
+1. 🏥 Single health check
+2. 📊 Comprehensive health check
+3. 🔄 Continuous monitoring (30s intervals)
+4. 📋 Generate uptime report (10 cycles)
+5. 🔍 Check Uptime Kuma status
+6. 🎯 Quick endpoint test
+"""
+
+
+def run_command(monitor: UptimeMonitor, command: str, args: argparse.Namespace):
+    """Run a single monitor command and print its outcome"""
+    if command == "health":
+        print("\n🏥 Running single health check...")
+        result = monitor.check_api_health()
+        print(f"Status: {result['status']}")
+        print(f"Response time: {result['response_time']:.3f}s")
+        print(f"Message: {result['message']}")
+
+    elif command == "check":
+        print("\n📊 Running comprehensive health check...")
+        results = monitor.run_comprehensive_health_check()
+        print(f"Overall Status: {results['overall_status']}")
+        print(f"Endpoints Up: {results['endpoints_up']}/{results['total_endpoints']}")
+        print(f"Average Response Time: {results['average_response_time']:.3f}s")
+
+        print("\nEndpoint Details:")
+        for endpoint_result in results["endpoint_results"]:
+            status_emoji = "✅" if endpoint_result["status"] == "up" else "❌"
+            print(
+                f"   {status_emoji} {endpoint_result['endpoint']} ({endpoint_result['method']}) - {endpoint_result['response_time']:.3f}s"
+            )
+
+    elif command == "monitor":
+        print("\n🔄 Starting continuous monitoring...")
+        print("   Press Ctrl+C to stop")
+        # SIGTERM (docker stop) ends the loop instead of waiting out the interval
+        signal.signal(signal.SIGTERM, lambda signum, frame: monitor.stop())
+        monitor.monitor_continuously(interval=args.interval)
+
+    elif command == "report":
+        print("\n📋 Generating uptime report...")
+        report = monitor.generate_uptime_report(cycles=args.cycles)
+        print(f"Uptime: {report['summary']['uptime_percentage']:.1f}%")
+        print(
+            f"Successful checks: {report['summary']['successful_checks']}/{report['summary']['total_checks']}"
+        )
+        print(
+            f"Average response time: {report['summary']['average_response_time']:.3f}s"
+        )
+
+    elif command == "kuma":
+        print("\n🔍 Checking Uptime Kuma status...")
+        result = monitor.check_uptime_kuma_status()
+        print(f"Status: {result['status']}")
+        print(f"URL: {result['url']}")
+        if "error" in result:
+            print(f"Error: {result['error']}")
+
+    elif command == "endpoint":
+        endpoint = args.endpoint or input("Enter endpoint to test (e.g., /health): ")
+        print(f"\n🎯 Testing {endpoint}...")
+        result = monitor.check_endpoint_health(endpoint)
+        print(f"Status: {result['status']}")
+        print(f"Response time: {result['response_time']:.3f}s")
+        print(f"Status code: {result['status_code']}")
+
+
 def main():
     """Main uptime monitor execution"""
+    parser = argparse.ArgumentParser(description="Uptime monitor")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=COMMANDS,
+        help="run one command non-interactively (default: interactive menu)",
+    )
+    parser.add_argument(
+        "--interval", type=int, default=30, help="seconds between monitor cycles"
+    )
+    parser.add_argument(
+        "--cycles", type=int, default=10, help="number of report cycles"
+    )
+    parser.add_argument("--endpoint", help="endpoint tested by the endpoint command")
+    args = parser.parse_args()
+
     print("📊 Uptime Monitor for IA Continu Solution")
     print("=" * 45)
 
     monitor = UptimeMonitor()
 
-    print("Choose an option:")
-    print("1. 🏥 Single health check")
-    print("2. 📊 Comprehensive health check")
-    print("3. 🔄 Continuous monitoring (30s intervals)")
-    print("4. 📋 Generate uptime report (10 cycles)")
-    print("5. 🔍 Check Uptime Kuma status")
-    print("6. 🎯 Quick endpoint test")
-
     try:
-        choice = input("\nEnter choice (1-6): ").strip()
-
-        if choice == "1":
-            print("\n🏥 Running single health check...")
-            result = monitor.check_api_health()
-            print(f"Status: {result['status']}")
-            print(f"Response time: {result['response_time']:.3f}s")
-            print(f"Message: {result['message']}")
-
-        elif choice == "2":
-            print("\n📊 Running comprehensive health check...")
-            results = monitor.run_comprehensive_health_check()
-            print(f"Overall Status: {results['overall_status']}")
-            print(
-                f"Endpoints Up: {results['endpoints_up']}/{results['total_endpoints']}"
-            )
-            print(f"Average Response Time: {results['average_response_time']:.3f}s")
-
-            print("\nEndpoint Details:")
-            for endpoint_result in results["endpoint_results"]:
-                status_emoji = "✅" if endpoint_result["status"] == "up" else "❌"
-                print(
-                    f"   {status_emoji} {endpoint_result['endpoint']} ({endpoint_result['method']}) - {endpoint_result['response_time']:.3f}s"
-                )
+        command = args.command
+        if command is None:
+            sys.stdout.write(MENU_TEXT)
+            sys.stdout.flush()
 
-        elif choice == "3":
-            print("\n🔄 Starting continuous monitoring...")
-            print("   Press Ctrl+C to stop")
-            monitor.monitor_continuously()
+            choice = input("\nEnter choice (1-6): ").strip()
+            command = MENU_CHOICES.get(choice)
 
-        elif choice == "4":
-            print("\n📋 Generating uptime report...")
-            report = monitor.generate_uptime_report()
-            print(f"Uptime: {report['summary']['uptime_percentage']:.1f}%")
-            print(
-                f"Successful checks: {report['summary']['successful_checks']}/{report['summary']['total_checks']}"
-            )
-            print(
-                f"Average response time: {report['summary']['average_response_time']:.3f}s"
-            )
-
-        elif choice == "5":
-            print("\n🔍 Checking Uptime Kuma status...")
-            result = monitor.check_uptime_kuma_status()
-            print(f"Status: {result['status']}")
-            print(f"URL: {result['url']}")
-            if "error" in result:
-                print(f"Error: {result['error']}")
-
-        elif choice == "6":
-            endpoint = input("Enter endpoint to test (e.g., /health): ")
-            print(f"\n🎯 Testing {endpoint}...")
-            result = monitor.check_endpoint_health(endpoint)
-            print(f"Status: {result['status']}")
-            print(f"Response time: {result['response_time']:.3f}s")
-            print(f"Status code: {result['status_code']}")
-
-        else:
+        if command is None:
             print("❌ Invalid choice")
+        else:
+            run_command(monitor, command, args)
 
     except KeyboardInterrupt:
         print("\n\n⏹️ Operation cancelled")
     except Exception as e:
         print(f"\n❌ Error: {e}")
+    finally:
+        monitor.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+JSON Encoding Helpers
+Shared JSON serialization for the API service modules
+"""
+
+import json
+from typing import Any
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert NumPy scalars (e.g. np.float64 metrics) to Python values"""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+# Payloads are encoded to UTF-8 bytes: orjson when it is installed, stdlib
+# json otherwise
+try:
+    import orjson
+
+    def encode_json(payload: dict) -> bytes:
+        return orjson.dumps(
+            payload, default=_to_builtin, option=orjson.OPT_SERIALIZE_NUMPY
+        )
+
+except ImportError:
+
+    def encode_json(payload: dict) -> bytes:
+        return json.dumps(payload, default=_to_builtin).encode("utf-8")
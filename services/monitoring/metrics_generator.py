@@ -4,6 +4,7 @@ Metrics Generator for IA Continu Solution Template
 Generates realistic metrics for Prometheus monitoring
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
 import random
@@ -14,6 +15,24 @@ import requests
 # Configuration
 API_URL = os.getenv("API_URL", "http://api:8000")
 PROMETHEUS_GATEWAY = os.getenv("PROMETHEUS_GATEWAY", "http://prometheus:9091")
+PREDICTION_RATE_LIMIT = float(os.getenv("PREDICTION_RATE_LIMIT", "20"))  # req/s
+
+
+class TokenBucket:
+    """Rate limiter that only sleeps when calls would exceed `rate` per second"""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self.next_allowed = time.monotonic()
+
+    def wait(self):
+        now = time.monotonic()
+        if now < self.next_allowed:
+            time.sleep(self.next_allowed - now)
+        self.next_allowed = max(now, self.next_allowed) + self.interval
+
+
+prediction_bucket = TokenBucket(PREDICTION_RATE_LIMIT)
 
 
 def generate_api_metrics():
@@ -33,13 +52,13 @@ def generate_api_metrics():
             # Generate some predictions
             for _ in range(random.randint(3, 8)):
                 features = [random.uniform(-2, 2), random.uniform(-2, 2)]
+                prediction_bucket.wait()
                 requests.post(
                     f"{API_URL}/predict",
                     json={"features": features},
                     headers=headers,
                     timeout=5,
                 )
-                time.sleep(0.5)
 
             # Check health
             requests.get(f"{API_URL}/health", timeout=5)
@@ -47,7 +66,7 @@ def generate_api_metrics():
             print(f"✅ Generated API metrics at {datetime.now()}")
             return True
 
-    except Exception as e:
+    except (requests.RequestException, KeyError, ValueError) as e:
         print(f"❌ Error generating API metrics: {e}")
         return False
 
@@ -111,14 +130,19 @@ def check_service_health():
         "uptime_kuma": "http://uptime-kuma:3001/",
     }
 
-    health_status = {}
-
-    for service, url in services.items():
+    def probe(url):
         try:
-            response = requests.get(url, timeout=3)
-            health_status[service] = 1 if response.status_code == 200 else 0
-        except Exception:
-            health_status[service] = 0
+            # Status only: stream=True avoids downloading the response body
+            with requests.get(url, timeout=3, stream=True) as response:
+                return 1 if response.status_code == 200 else 0
+        except requests.RequestException:
+            return 0
+
+    # Probe every service in parallel (worst case 3s instead of 3s per service)
+    with ThreadPoolExecutor(max_workers=len(services)) as executor:
+        health_status = dict(
+            zip(services, executor.map(probe, services.values()), strict=True)
+        )
 
     healthy_count = sum(health_status.values())
     total_count = len(health_status)
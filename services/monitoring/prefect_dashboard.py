@@ -19,6 +19,10 @@ app = Flask(__name__)
 API_URL = os.getenv("API_URL", "http://api:8000")
 DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL", "")
 
+# Discord embed color per notification severity
+SEVERITY_COLORS = {"info": 3447003, "warning": 16776960, "error": 15158332}
+DEFAULT_COLOR = SEVERITY_COLORS["info"]
+
 # Store flow run data
 flow_runs = []
 flow_stats = {
@@ -120,17 +124,19 @@ def run_ml_monitoring_flow():
                     token = login_response.json()["access_token"]
                     headers = {"Authorization": f"Bearer {token}"}
 
-                    # Make predictions
-                    for _ in range(random.randint(3, 8)):
-                        features = [random.uniform(-2, 2), random.uniform(-2, 2)]
-                        pred_response = requests.post(
-                            f"{API_URL}/predict",
-                            json={"features": features},
-                            headers=headers,
-                            timeout=5,
-                        )
-                        if pred_response.status_code == 200:
-                            predictions_count += 1
+                    # Make predictions in a single batch request
+                    features = [
+                        [random.uniform(-2, 2), random.uniform(-2, 2)]
+                        for _ in range(random.randint(3, 8))
+                    ]
+                    pred_response = requests.post(
+                        f"{API_URL}/predict/batch",
+                        json={"features": features},
+                        headers=headers,
+                        timeout=5,
+                    )
+                    if pred_response.status_code == 200:
+                        predictions_count = pred_response.json()["count"]
             except Exception:
                 pass
 
@@ -208,12 +214,10 @@ def send_discord_notification(message, severity="info"):
         return
 
     try:
-        color_map = {"info": 3447003, "warning": 16776960, "error": 15158332}
-
         embed = {
             "title": "🤖 IA Continu Solution - Prefect Flow",
             "description": message,
-            "color": color_map.get(severity, 3447003),
+            "color": SEVERITY_COLORS.get(severity, DEFAULT_COLOR),
             "timestamp": datetime.now().isoformat(),
             "footer": {"text": "IA Continu Solution - Enterprise Template"},
         }
@@ -4,10 +4,15 @@ Enhanced Monitoring Service - Day 4
 Comprehensive monitoring with Discord integration for Uptime Kuma and system alerts
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+import json
 import logging
 import os
 from pathlib import Path
+import queue
+import signal
+import threading
 import time
 from typing import Any
 
@@ -24,6 +29,38 @@ GRAFANA_URL = os.getenv("GRAFANA_URL", "http://grafana:3000")
 
 MONITORING_INTERVAL = int(os.getenv("MONITORING_INTERVAL", "60"))  # 60 seconds
 
+# Discord payloads are posted as pre-encoded UTF-8 bytes: orjson when it is
+# installed, stdlib json otherwise
+try:
+    import orjson
+
+    def encode_json(payload: dict) -> bytes:
+        return orjson.dumps(payload)
+
+except ImportError:
+
+    def encode_json(payload: dict) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Pending Discord alerts kept while the webhook is slow; extra ones are dropped
+NOTIFICATION_QUEUE_SIZE = 100
+
+# Embed colors by notification status
+COLOR_MAP = {
+    "Succès": 5814783,  # Green
+    "Échec": 15158332,  # Red
+    "Avertissement": 16776960,  # Yellow
+    "Info": 3447003,  # Blue
+    "Critical": 10038562,  # Dark Red
+    "Recovery": 3066993,  # Dark Green
+}
+DEFAULT_COLOR = COLOR_MAP["Info"]
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
 # Setup logging
 logs_dir = Path("logs")
 logs_dir.mkdir(exist_ok=True)
@@ -65,25 +102,52 @@ class EnhancedMonitoringService:
         self.last_status = {}
         self.alert_history = []
 
+        # Set by the SIGTERM handler: wakes the loop at once instead of after
+        # the end of the current sleep
+        self.stop_event = threading.Event()
+
+        # Keep-alive session shared by the health probes and Discord alerts
+        self.session = requests.Session()
+
+        # Discord alerts are posted by a background thread so a slow webhook
+        # never delays a monitoring cycle
+        self.notification_queue = queue.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+        if DISCORD_WEBHOOK_URL:
+            threading.Thread(
+                target=self._notification_worker, name="discord-notifier", daemon=True
+            ).start()
+
+    def _notification_worker(self):
+        """Post queued Discord payloads one at a time"""
+        while True:
+            message, data = self.notification_queue.get()
+            try:
+                response = self.session.post(
+                    DISCORD_WEBHOOK_URL,
+                    data=encode_json(data),
+                    headers=JSON_HEADERS,
+                    timeout=10,
+                )
+                if response.status_code == 204:
+                    logger.info(f"✅ Discord notification sent: {message}")
+                else:
+                    logger.error(
+                        f"❌ Discord notification failed: {response.status_code}"
+                    )
+            except Exception as e:
+                logger.error(f"❌ Discord notification error: {e}")
+            finally:
+                self.notification_queue.task_done()
+
     def send_discord_notification(
         self, message: str, status: str = "Info", title: str = "System Monitoring"
     ) -> bool:
-        """Send Discord notification with enhanced formatting"""
+        """Queue a Discord notification with enhanced formatting"""
         if not DISCORD_WEBHOOK_URL:
             logger.warning("Discord webhook not configured")
             return False
 
-        # Color mapping
-        color_map = {
-            "Succès": 5814783,  # Green
-            "Échec": 15158332,  # Red
-            "Avertissement": 16776960,  # Yellow
-            "Info": 3447003,  # Blue
-            "Critical": 10038562,  # Dark Red
-            "Recovery": 3066993,  # Dark Green
-        }
-
-        color = color_map.get(status, 3447003)
+        color = COLOR_MAP.get(status, DEFAULT_COLOR)
 
         data = {
             "embeds": [
@@ -95,9 +159,7 @@ class EnhancedMonitoringService:
                         {"name": "Status", "value": status, "inline": True},
                         {
                             "name": "Timestamp",
-                            "value": datetime.now(UTC).strftime(
-                                "%Y-%m-%d %H:%M:%S UTC"
-                            ),
+                            "value": time.strftime(TIMESTAMP_FORMAT, time.gmtime()),
                             "inline": True,
                         },
                         {
@@ -114,15 +176,10 @@ class EnhancedMonitoringService:
         }
 
         try:
-            response = requests.post(DISCORD_WEBHOOK_URL, json=data, timeout=10)
-            if response.status_code == 204:
-                logger.info(f"✅ Discord notification sent: {message}")
-                return True
-            else:
-                logger.error(f"❌ Discord notification failed: {response.status_code}")
-                return False
-        except Exception as e:
-            logger.error(f"❌ Discord notification error: {e}")
+            self.notification_queue.put_nowait((message, data))
+            return True
+        except queue.Full:
+            logger.error("❌ Discord notification dropped: queue is full")
             return False
 
     def check_service_health(
@@ -130,8 +187,12 @@ class EnhancedMonitoringService:
     ) -> dict[str, Any]:
         """Check health of a specific service"""
         try:
-            response = requests.get(service_info["url"], timeout=10)
-            is_healthy = response.status_code in [200, 201, 202]
+            # Only the status line matters: stream=True skips downloading the
+            # body (HTML pages for Grafana, MLflow and Uptime Kuma)
+            with self.session.get(
+                service_info["url"], timeout=10, stream=True
+            ) as response:
+                is_healthy = response.status_code in [200, 201, 202]
 
             return {
                 "service": service_key,
@@ -153,12 +214,17 @@ class EnhancedMonitoringService:
 
     def check_all_services(self) -> dict[str, Any]:
         """Check health of all monitored services"""
-        results = {}
-
-        for service_key, service_info in self.services.items():
-            results[service_key] = self.check_service_health(service_key, service_info)
+        # Probe all services in parallel: a cycle now takes as long as the
+        # slowest service instead of the sum of every probe (up to 10s each)
+        with ThreadPoolExecutor(max_workers=len(self.services)) as executor:
+            futures = {
+                service_key: executor.submit(
+                    self.check_service_health, service_key, service_info
+                )
+                for service_key, service_info in self.services.items()
+            }
 
-        return results
+        return {service_key: future.result() for service_key, future in futures.items()}
 
     def detect_status_changes(
         self, current_status: dict[str, Any]
@@ -187,40 +253,55 @@ class EnhancedMonitoringService:
         return changes
 
     def send_status_change_alerts(self, changes: list[dict[str, Any]]):
-        """Send Discord alerts for status changes"""
+        """Send Discord alerts for status changes, batched into one message"""
+        failures = []
+        recoveries = []
+
         for change in changes:
             service_name = change["name"]
             change_type = change["change_type"]
+            current = change["current_status"]
 
             if change_type == "failure":
-                message = "🚨 **Service Down Alert**\n\n"
-                message += f"**Service:** {service_name}\n"
+                message = f"**Service:** {service_name}\n"
                 message += "**Status:** ❌ Unhealthy\n"
 
-                current = change["current_status"]
                 if "error" in current:
                     message += f"**Error:** {current['error']}\n"
                 elif "status_code" in current:
                     message += f"**Status Code:** {current['status_code']}\n"
 
                 message += f"**Time:** {current.get('timestamp', 'N/A')}"
-
-                self.send_discord_notification(message, "Critical", "🚨 Service Alert")
+                failures.append(message)
 
             elif change_type == "recovery":
-                message = "✅ **Service Recovery**\n\n"
-                message += f"**Service:** {service_name}\n"
+                message = f"**Service:** {service_name}\n"
                 message += "**Status:** ✅ Healthy\n"
 
-                current = change["current_status"]
                 if current.get("response_time"):
                     message += f"**Response Time:** {current['response_time']:.3f}s\n"
 
                 message += f"**Time:** {current.get('timestamp', 'N/A')}"
+                recoveries.append(message)
 
-                self.send_discord_notification(
-                    message, "Recovery", "✅ Service Recovery"
-                )
+        # One webhook call per cycle instead of one per status change
+        sections = []
+        if failures:
+            sections.append("🚨 **Service Down Alert**\n\n" + "\n\n".join(failures))
+        if recoveries:
+            sections.append("✅ **Service Recovery**\n\n" + "\n\n".join(recoveries))
+
+        if not sections:
+            return
+
+        if failures:
+            self.send_discord_notification(
+                "\n\n".join(sections), "Critical", "🚨 Service Alert"
+            )
+        else:
+            self.send_discord_notification(
+                "\n\n".join(sections), "Recovery", "✅ Service Recovery"
+            )
 
     def generate_health_summary(self, status: dict[str, Any]) -> str:
         """Generate a comprehensive health summary"""
@@ -307,9 +388,16 @@ class EnhancedMonitoringService:
         )
 
         try:
-            while True:
+            while not self.stop_event.is_set():
                 self.run_monitoring_cycle()
-                time.sleep(MONITORING_INTERVAL)
+                self.stop_event.wait(MONITORING_INTERVAL)
+
+            logger.info("🛑 Monitoring service stopped")
+            self.send_discord_notification(
+                "🛑 **Monitoring Service Stopped**\n\nService stopped by SIGTERM.",
+                "Avertissement",
+                "⚠️ Service Shutdown",
+            )
 
         except KeyboardInterrupt:
             logger.info("🛑 Monitoring service stopped by user")
@@ -325,8 +413,14 @@ class EnhancedMonitoringService:
                 "Échec",
                 "🚨 Service Error",
             )
+        finally:
+            # Deliver the shutdown/error alert before the process exits
+            self.notification_queue.join()
 
 
 if __name__ == "__main__":
     monitoring_service = EnhancedMonitoringService()
+    signal.signal(
+        signal.SIGTERM, lambda signum, frame: monitoring_service.stop_event.set()
+    )
     monitoring_service.run()
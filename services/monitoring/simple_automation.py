@@ -4,7 +4,9 @@ Simple ML Automation Script - Alternative to Prefect
 Runs continuous monitoring and drift detection every 30 seconds
 """
 
-from datetime import UTC, datetime
+from datetime import datetime
+from functools import lru_cache
+import json
 import os
 import random
 import time
@@ -15,6 +17,49 @@ import requests
 API_URL = os.getenv("API_URL", "http://api:8000")
 DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
 
+# Shared HTTP session: connections are kept alive between automation cycles
+http_session = requests.Session()
+
+# Discord payloads are posted as pre-encoded UTF-8 bytes: orjson when it is
+# installed, stdlib json otherwise
+try:
+    import orjson
+
+    def encode_json(payload: dict) -> bytes:
+        return orjson.dumps(payload)
+
+except ImportError:
+
+    def encode_json(payload: dict) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Embed colors by notification status
+COLOR_MAP = {
+    "Succès": 5814783,  # Green
+    "Échec": 15158332,  # Red
+    "Avertissement": 16776960,  # Yellow
+    "Info": 3447003,  # Blue
+    "Drift": 16753920,  # Orange
+}
+DEFAULT_COLOR = COLOR_MAP["Info"]
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+# Cached auth tokens are renewed every 25 minutes (well within the JWT lifetime)
+TOKEN_TTL_SECONDS = 1500
+
+# Simulated drift: one precomputed value per 30s slot over a week, seeded so the
+# sequence of drift ticks is reproducible; each cycle only indexes the table
+DRIFT_SLOT_SECONDS = 30
+DRIFT_THRESHOLD = 0.5
+_drift_rng = random.Random(0)
+DRIFT_SCHEDULE = tuple(
+    _drift_rng.random() for _ in range(7 * 24 * 3600 // DRIFT_SLOT_SECONDS)
+)
+
 
 def send_discord_notification(
     message: str, status: str = "Succès", title: str = "🤖 ML Automation"
@@ -24,25 +69,17 @@ def send_discord_notification(
         print(f"Discord webhook not configured. Message: {message}")
         return False
 
-    color_map = {
-        "Succès": 5814783,  # Green
-        "Échec": 15158332,  # Red
-        "Avertissement": 16776960,  # Yellow
-        "Info": 3447003,  # Blue
-        "Drift": 16753920,  # Orange
-    }
-
     data = {
         "embeds": [
             {
                 "title": title,
                 "description": message,
-                "color": color_map.get(status, 3447003),
+                "color": COLOR_MAP.get(status, DEFAULT_COLOR),
                 "fields": [
                     {"name": "Status", "value": status, "inline": True},
                     {
                         "name": "Timestamp",
-                        "value": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC"),
+                        "value": time.strftime(TIMESTAMP_FORMAT, time.gmtime()),
                         "inline": True,
                     },
                     {"name": "Service", "value": "ML Automation", "inline": True},
@@ -53,7 +90,12 @@ def send_discord_notification(
     }
 
     try:
-        response = requests.post(DISCORD_WEBHOOK_URL, json=data, timeout=10)
+        response = http_session.post(
+            DISCORD_WEBHOOK_URL,
+            data=encode_json(data),
+            headers=JSON_HEADERS,
+            timeout=10,
+        )
         if response.status_code == 204:
             print(f"✅ Discord notification sent: {message[:50]}...")
             return True
@@ -66,24 +108,51 @@ def send_discord_notification(
 
 
 def authenticate():
-    """Authenticate with API"""
+    """Authenticate with API, reusing the cached token within its TTL window"""
+    token = _authenticate_cached(int(time.time() // TOKEN_TTL_SECONDS))
+    if token is None:
+        # Never keep a failed login in the cache
+        _authenticate_cached.cache_clear()
+    return token
+
+
+@lru_cache(maxsize=1)
+def _authenticate_cached(ttl_bucket: int):
+    """Log in once per TTL bucket"""
     try:
-        response = requests.post(
+        response = http_session.post(
             f"{API_URL}/auth/login",
             json={"username": "admin", "password": "admin123"},
             timeout=10,
         )
         if response.status_code == 200:
             return response.json()["access_token"]
-    except Exception as e:
+    except (requests.RequestException, KeyError, ValueError) as e:
         print(f"Auth error: {e}")
     return None
 
 
+def post_authenticated(token: str, url: str, **kwargs) -> requests.Response:
+    """POST with a bearer token, logging in again once if it was rejected"""
+    response = http_session.post(
+        url, headers={"Authorization": f"Bearer {token}"}, **kwargs
+    )
+    if response.status_code == 401:
+        # Token revoked or API database reset: drop the cached token and retry
+        _authenticate_cached.cache_clear()
+        token = authenticate()
+        if token:
+            response = http_session.post(
+                url, headers={"Authorization": f"Bearer {token}"}, **kwargs
+            )
+    return response
+
+
 def detect_drift():
     """Simple drift detection"""
-    random_value = random.random()
-    drift_detected = random_value < 0.5
+    slot = int(time.time() // DRIFT_SLOT_SECONDS) % len(DRIFT_SCHEDULE)
+    random_value = DRIFT_SCHEDULE[slot]
+    drift_detected = random_value < DRIFT_THRESHOLD
 
     return {
         "drift_detected": drift_detected,
@@ -98,7 +167,7 @@ def run_automation_cycle(cycle_count=0):
 
     # Check API health
     try:
-        health = requests.get(f"{API_URL}/health", timeout=5)
+        health = http_session.get(f"{API_URL}/health", timeout=5)
         if health.status_code != 200:
             print("❌ API unhealthy, skipping cycle")
             send_discord_notification(
@@ -132,13 +201,12 @@ def run_automation_cycle(cycle_count=0):
         # Authenticate and generate new data
         token = authenticate()
         if token:
-            headers = {"Authorization": f"Bearer {token}"}
             try:
                 # Generate new training data
-                gen_response = requests.post(
+                gen_response = post_authenticated(
+                    token,
                     f"{API_URL}/generate",
                     json={"samples": 100},
-                    headers=headers,
                     timeout=30,
                 )
                 if gen_response.status_code == 200:
@@ -6,10 +6,14 @@ Automated data generation and processing workflow
 from datetime import datetime
 import random
 
+import numpy as np
 from prefect import flow, task
 from prefect.logging import get_run_logger
 import requests
 
+# Module-level generator for the simulated prediction features
+rng = np.random.default_rng()
+
 
 @task(name="authenticate_api", retries=2, retry_delay_seconds=3)
 def authenticate_api() -> str:
@@ -131,29 +135,31 @@ def run_model_predictions(token: str, num_predictions: int = 10) -> dict[str, an
 
         logger.info(f"Running {num_predictions} model predictions")
 
-        for i in range(num_predictions):
-            # Generate random features
-            features = [random.uniform(-3, 3), random.uniform(-3, 3)]
-
-            response = requests.post(
-                "http://host.docker.internal:8000/predict",
-                json={"features": features},
-                headers=headers,
-                timeout=10,
-            )
-
-            if response.status_code == 200:
-                pred_data = response.json()
-                predictions.append(
-                    {
-                        "features": features,
-                        "prediction": pred_data["prediction"],
-                        "confidence": pred_data.get("confidence", 0.5),
-                        "timestamp": datetime.now().isoformat(),
-                    }
+        # Generate random features (one vectorized draw for the whole batch)
+        feature_batch = rng.uniform(-3, 3, size=(num_predictions, 2)).tolist()
+
+        # All feature vectors scored in a single /predict/batch round trip
+        response = requests.post(
+            "http://host.docker.internal:8000/predict/batch",
+            json={"features": feature_batch},
+            headers=headers,
+            timeout=10,
+        )
+
+        if response.status_code == 200:
+            predictions = [
+                {
+                    "features": features,
+                    "prediction": pred_data["prediction"],
+                    "confidence": pred_data.get("confidence", 0.5),
+                    "timestamp": datetime.now().isoformat(),
+                }
+                for features, pred_data in zip(
+                    feature_batch, response.json()["predictions"], strict=True
                 )
-            else:
-                logger.warning(f"Prediction {i + 1} failed: {response.status_code}")
+            ]
+        else:
+            logger.warning(f"Batch prediction failed: {response.status_code}")
 
         success_rate = len(predictions) / num_predictions
 
@@ -4,14 +4,16 @@ Enhanced Prefect ML Automation Flow - Day 4
 Comprehensive ML pipeline automation with drift detection and automated retraining
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+import json
 import os
 from pathlib import Path
-import random
 import time
 
 import numpy as np
 from prefect import flow, get_run_logger, task
+from prefect.tasks import exponential_backoff
 import requests
 
 # Configuration
@@ -19,30 +21,66 @@ API_URL = os.getenv("API_URL", "http://api:8000")
 DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
 MLFLOW_URL = os.getenv("MLFLOW_TRACKING_URI", "http://mlflow:5000")
 
+# Shared HTTP session: keep-alive connections are reused across tasks and runs.
+# No adapter-level Retry: tasks raise on connection errors and 429/5xx
+# responses and the Prefect task retries (jittered exponential backoff) are
+# the only retry layer, so an outage does not multiply attempts
+http_session = requests.Session()
+
+# Discord payloads are posted as pre-encoded UTF-8 bytes: orjson when it is
+# installed, stdlib json otherwise
+try:
+    import orjson
+
+    def encode_json(payload: dict) -> bytes:
+        return orjson.dumps(payload)
+
+except ImportError:
+
+    def encode_json(payload: dict) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Embed colors by notification status
+COLOR_MAP = {
+    "Succès": 5814783,  # Green
+    "Échec": 15158332,  # Red
+    "Avertissement": 16776960,  # Yellow
+    "Info": 3447003,  # Blue
+    "Drift": 16753920,  # Orange
+}
+DEFAULT_COLOR = COLOR_MAP["Info"]
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+# Module-level random generator shared by the drift and training simulations
+rng = np.random.default_rng()
+
+
+def raise_for_transient_status(response: requests.Response) -> None:
+    """Raise HTTPError on 429/5xx responses so the calling task is retried"""
+    if response.status_code == 429 or response.status_code >= 500:
+        response.raise_for_status()
+
+
 # Setup logging
 logs_dir = Path("logs")
 logs_dir.mkdir(exist_ok=True)
 
 
-@task(retries=3, retry_delay_seconds=2)
-def send_discord_notification(
+@task(
+    name="send_discord_notification",
+    retries=3,
+    retry_delay_seconds=exponential_backoff(backoff_factor=2),
+    retry_jitter_factor=0.5,
+)
+def discord_notification_task(
     message: str, status: str = "Succès", title: str = "ML Pipeline Automation"
 ) -> bool:
     """Enhanced Discord notification with comprehensive formatting"""
-    if not DISCORD_WEBHOOK_URL:
-        print("Discord webhook not configured")
-        return False
-
-    # Color mapping
-    color_map = {
-        "Succès": 5814783,  # Green
-        "Échec": 15158332,  # Red
-        "Avertissement": 16776960,  # Yellow
-        "Info": 3447003,  # Blue
-        "Drift": 16753920,  # Orange
-    }
-
-    color = color_map.get(status, 3447003)
+    color = COLOR_MAP.get(status, DEFAULT_COLOR)
 
     data = {
         "embeds": [
@@ -54,7 +92,7 @@ def send_discord_notification(
                     {"name": "Status", "value": status, "inline": True},
                     {
                         "name": "Timestamp",
-                        "value": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC"),
+                        "value": time.strftime(TIMESTAMP_FORMAT, time.gmtime()),
                         "inline": True,
                     },
                     {
@@ -71,44 +109,94 @@ def send_discord_notification(
     }
 
     try:
-        response = requests.post(DISCORD_WEBHOOK_URL, json=data, timeout=10)
+        response = http_session.post(
+            DISCORD_WEBHOOK_URL,
+            data=encode_json(data),
+            headers=JSON_HEADERS,
+            timeout=10,
+        )
+        raise_for_transient_status(response)
         if response.status_code == 204:
             print(f"✅ Discord notification sent: {message}")
             return True
         else:
             print(f"❌ Discord notification failed: {response.status_code}")
             return False
+    except requests.RequestException as e:
+        # Rate limited or unreachable: fail the attempt so the task retries
+        print(f"❌ Discord notification error: {e}")
+        raise
     except Exception as e:
         print(f"❌ Discord notification error: {e}")
         return False
 
 
-@task(retries=2, retry_delay_seconds=1)
+def notify_discord(
+    message: str, status: str = "Succès", title: str = "ML Pipeline Automation"
+) -> bool:
+    """Send through the retried task; still failing after retries returns False"""
+    state = discord_notification_task(message, status, title, return_state=True)
+    return state.result() if state.is_completed() else False
+
+
+def skip_discord_notification(
+    message: str, status: str = "Succès", title: str = "ML Pipeline Automation"
+) -> bool:
+    """No-op notification used when no Discord webhook is configured"""
+    return False
+
+
+# Resolved once at import: without a webhook, notifications are a plain no-op
+# instead of a Prefect task run that immediately returns
+if DISCORD_WEBHOOK_URL:
+    send_discord_notification = notify_discord
+else:
+    print("Discord webhook not configured - notifications disabled")
+    send_discord_notification = skip_discord_notification
+
+
+@task(
+    retries=2,
+    retry_delay_seconds=exponential_backoff(backoff_factor=1),
+    retry_jitter_factor=0.5,
+)
 def check_api_health() -> bool:
     """Check API health before proceeding with ML operations"""
     logger = get_run_logger()
 
     try:
-        response = requests.get(f"{API_URL}/health", timeout=10)
+        response = http_session.get(f"{API_URL}/health", timeout=10)
+        raise_for_transient_status(response)
         if response.status_code == 200:
             logger.info("✅ API health check passed")
             return True
         else:
             logger.warning(f"❌ API health check failed: {response.status_code}")
             return False
+    except requests.RequestException as e:
+        # API restarting or unreachable: fail the attempt so the task retries
+        logger.warning(f"⚠️ API health check error: {e}")
+        raise
     except Exception as e:
         logger.error(f"❌ API health check error: {e}")
         return False
 
 
-@task(retries=2, retry_delay_seconds=1)
+@task(
+    retries=2,
+    retry_delay_seconds=exponential_backoff(backoff_factor=1),
+    retry_jitter_factor=0.5,
+)
 def authenticate_api():
     """Authenticate with API and return JWT token"""
     logger = get_run_logger()
 
     try:
         login_data = {"username": "admin", "password": "admin123"}
-        response = requests.post(f"{API_URL}/auth/login", json=login_data, timeout=10)
+        response = http_session.post(
+            f"{API_URL}/auth/login", json=login_data, timeout=10
+        )
+        raise_for_transient_status(response)
 
         if response.status_code == 200:
             token = response.json()["access_token"]
@@ -117,18 +205,26 @@ def authenticate_api():
         else:
             logger.error(f"❌ API authentication failed: {response.status_code}")
             return None
+    except requests.RequestException as e:
+        # API restarting or unreachable: fail the attempt so the task retries
+        logger.warning(f"⚠️ API authentication error: {e}")
+        raise
     except Exception as e:
         logger.error(f"❌ API authentication error: {e}")
         return None
 
 
-@task(retries=2, retry_delay_seconds=1)
+@task(
+    retries=2,
+    retry_delay_seconds=exponential_backoff(backoff_factor=1),
+    retry_jitter_factor=0.5,
+)
 def detect_model_drift():
     """Advanced model drift detection using multiple methods"""
     logger = get_run_logger()
 
     # Method 1: Random simulation (as per original requirement)
-    random_value = random.random()
+    random_value = float(rng.random())
     logger.info(f"Random drift check: {random_value}")
 
     # Method 2: Performance-based drift detection
@@ -144,7 +240,10 @@ def detect_model_drift():
 
     try:
         # Get current model performance
-        response = requests.get(f"{API_URL}/model/info", headers=headers, timeout=10)
+        response = http_session.get(
+            f"{API_URL}/model/info", headers=headers, timeout=10
+        )
+        raise_for_transient_status(response)
         if response.status_code == 200:
             model_info = response.json()
             logger.info(f"Current model info: {model_info}")
@@ -153,15 +252,15 @@ def detect_model_drift():
         test_features = [[0.5, 0.5], [1.0, 1.0], [-0.5, -0.5]]
         predictions = []
 
-        for features in test_features:
-            pred_response = requests.post(
-                f"{API_URL}/predict",
-                json={"features": features},
-                headers=headers,
-                timeout=10,
-            )
-            if pred_response.status_code == 200:
-                predictions.append(pred_response.json())
+        pred_response = http_session.post(
+            f"{API_URL}/predict/batch",
+            json={"features": test_features},
+            headers=headers,
+            timeout=10,
+        )
+        raise_for_transient_status(pred_response)
+        if pred_response.status_code == 200:
+            predictions = pred_response.json()["predictions"]
 
         # Analyze predictions for consistency
         confidences = [p["confidence"] for p in predictions if "confidence" in p]
@@ -183,6 +282,10 @@ def detect_model_drift():
             "details": f"Random: {random_value:.3f}, Confidence: {avg_confidence:.3f}",
         }
 
+    except requests.RequestException as e:
+        # API restarting or unreachable: fail the attempt so the task retries
+        logger.warning(f"⚠️ Drift detection request error: {e}")
+        raise
     except Exception as e:
         logger.error(f"❌ Drift detection error: {e}")
         return {
@@ -193,7 +296,11 @@ def detect_model_drift():
         }
 
 
-@task(retries=2, retry_delay_seconds=5)
+@task(
+    retries=2,
+    retry_delay_seconds=exponential_backoff(backoff_factor=5),
+    retry_jitter_factor=0.5,
+)
 def automated_model_retraining(drift_info):
     """Automated model retraining triggered by drift detection"""
     logger = get_run_logger()
@@ -214,9 +321,10 @@ def automated_model_retraining(drift_info):
     try:
         # Step 1: Generate new training data
         logger.info("📊 Generating new training dataset...")
-        gen_response = requests.post(
+        gen_response = http_session.post(
             f"{API_URL}/generate", json={"samples": 1000}, headers=headers, timeout=30
         )
+        raise_for_transient_status(gen_response)
 
         if gen_response.status_code != 200:
             raise Exception(f"Dataset generation failed: {gen_response.status_code}")
@@ -232,7 +340,7 @@ def automated_model_retraining(drift_info):
         retrain_data = {
             "model_version": f"auto_retrain_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             "current_accuracy": 0.85
-            + random.random() * 0.1,  # Simulate improved accuracy
+            + float(rng.random()) * 0.1,  # Simulate improved accuracy
             "timestamp": datetime.now(UTC).isoformat(),
             "retrain_triggered": True,
             "training_samples": gen_data["samples_created"],
@@ -262,6 +370,10 @@ def automated_model_retraining(drift_info):
             "drift_info": drift_info,
         }
 
+    except requests.RequestException as e:
+        # API restarting or unreachable: fail the attempt so the task retries
+        logger.warning(f"⚠️ Retraining request error: {e}")
+        raise
     except Exception as e:
         logger.error(f"❌ Automated retraining failed: {e}")
 
@@ -278,31 +390,45 @@ def automated_model_retraining(drift_info):
         return {"status": "failed", "error": str(e), "drift_info": drift_info}
 
 
+def probe_api_health() -> bool:
+    """Return True if the API /health endpoint answers 200"""
+    try:
+        # Short connect timeout so an unreachable host fails fast
+        api_response = http_session.get(f"{API_URL}/health", timeout=(1, 5))
+        return api_response.status_code == 200
+    except requests.RequestException:
+        return False
+
+
+def probe_mlflow_health() -> bool:
+    """Return True if the MLflow UI answers 200"""
+    try:
+        # The MLflow root serves the whole UI page; read the status line only
+        with http_session.get(
+            f"{MLFLOW_URL}/", timeout=(1, 5), stream=True
+        ) as mlflow_response:
+            return mlflow_response.status_code == 200
+    except requests.RequestException:
+        return False
+
+
 @task
 def monitor_system_health():
     """Monitor overall system health and send alerts if needed"""
     logger = get_run_logger()
 
+    # Both probes run concurrently: a dead service costs its own timeout once
+    # instead of delaying the other check
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        api_future = executor.submit(probe_api_health)
+        mlflow_future = executor.submit(probe_mlflow_health)
+
     health_status = {
-        "api": False,
-        "mlflow": False,
+        "api": api_future.result(),
+        "mlflow": mlflow_future.result(),
         "timestamp": datetime.now(UTC).isoformat(),
     }
 
-    # Check API health
-    try:
-        api_response = requests.get(f"{API_URL}/health", timeout=5)
-        health_status["api"] = api_response.status_code == 200
-    except Exception:
-        health_status["api"] = False
-
-    # Check MLflow health
-    try:
-        mlflow_response = requests.get(f"{MLFLOW_URL}/", timeout=5)
-        health_status["mlflow"] = mlflow_response.status_code == 200
-    except Exception:
-        health_status["mlflow"] = False
-
     # Send alert if any service is down
     if not all([health_status["api"], health_status["mlflow"]]):
         send_discord_notification(
@@ -318,6 +444,39 @@ def monitor_system_health():
     return health_status
 
 
+# Service URLs already seen responding: later waits skip them
+ready_services: set[str] = set()
+
+
+def wait_for_services(urls: list[str], deadline: float = 60) -> bool:
+    """Poll service URLs with exponential backoff until they all respond"""
+    pending = [url for url in urls if url not in ready_services]
+    # Short first delay for the common already-up case, doubled up to 5s
+    backoff = 0.1
+    end_time = time.monotonic() + deadline
+
+    while pending:
+        for url in list(pending):
+            try:
+                # HEAD: any response means the server is up, skip the body
+                http_session.head(url, timeout=1)
+                pending.remove(url)
+                ready_services.add(url)
+                print(f"✅ Service ready: {url}")
+            except requests.RequestException:
+                pass
+
+        if not pending:
+            break
+        if time.monotonic() + backoff > end_time:
+            return False
+
+        time.sleep(backoff)
+        backoff = min(backoff * 2, 5)
+
+    return True
+
+
 @flow(name="ml-automation-pipeline", log_prints=True)
 def ml_automation_pipeline():
     """Main ML automation pipeline flow"""
@@ -371,7 +530,8 @@ def ml_automation_pipeline():
 if __name__ == "__main__":
     # Wait for services to be ready
     print("🔄 Waiting for services to be ready...")
-    time.sleep(30)
+    if not wait_for_services([f"{API_URL}/health", f"{MLFLOW_URL}/"]):
+        print("⚠️ Services not ready after 60s, starting anyway")
 
     # Send startup notification
     send_discord_notification(
@@ -4,13 +4,17 @@ Streamlit UI for IA Continu Solution
 Interface utilisateur pour tester l'API avec authentification
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
 import random
 
 import pandas as pd
 import plotly.express as px
 import requests
+from requests.adapters import HTTPAdapter
 import streamlit as st
+from urllib3.util import Retry
 
 # Configuration de la page
 st.set_page_config(
@@ -24,12 +28,27 @@ st.set_page_config(
 API_BASE_URL = os.getenv("API_URL", "http://host.docker.internal:8000")
 
 
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Session HTTP partagée entre les reruns Streamlit (connexions keep-alive)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=1, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class APIClient:
     """Client pour interagir avec l'API"""
 
     def __init__(self, base_url: str, token: str | None = None):
         self.base_url = base_url
         self.token = token
+        self.session = get_http_session()
         self.headers = {}
         if token:
             self.headers["Authorization"] = f"Bearer {token}"
@@ -37,7 +56,7 @@ class APIClient:
     def health_check(self):
         """Vérifier la santé de l'API"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/health", headers=self.headers, timeout=5
             )
             return (
@@ -51,7 +70,7 @@ class APIClient:
         """Faire une prédiction"""
         try:
             payload = {"features": features}
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/predict",
                 json=payload,
                 headers=self.headers,
@@ -64,11 +83,28 @@ class APIClient:
         except Exception as e:
             return False, str(e)
 
+    def predict_batch(self, features_list):
+        """Faire plusieurs prédictions en un seul appel"""
+        try:
+            payload = {"features": features_list}
+            response = self.session.post(
+                f"{self.base_url}/predict/batch",
+                json=payload,
+                headers=self.headers,
+                timeout=10,
+            )
+            return (
+                response.status_code == 200,
+                response.json() if response.status_code == 200 else response.text,
+            )
+        except Exception as e:
+            return False, str(e)
+
     def generate_dataset(self, samples=1000):
         """Générer un nouveau dataset"""
         try:
             payload = {"samples": samples}
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/generate",
                 json=payload,
                 headers=self.headers,
@@ -88,7 +124,7 @@ class APIClient:
     def get_model_info(self):
         """Obtenir les informations du modèle"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/model/info", headers=self.headers, timeout=5
             )
             return (
@@ -101,7 +137,7 @@ class APIClient:
     def list_datasets(self):
         """Lister les datasets"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/datasets/list", headers=self.headers, timeout=10
             )
             return (
@@ -143,7 +179,7 @@ def authenticate():
                 # Obtenir le token via l'API
                 try:
                     login_data = {"username": username, "password": password}
-                    response = requests.post(
+                    response = get_http_session().post(
                         f"{API_BASE_URL}/auth/login", json=login_data, timeout=10
                     )
 
@@ -270,23 +306,31 @@ def prediction_interface():
         if st.button("🎲 Générer prédictions aléatoires"):
             predictions_data = []
 
-            progress_bar = st.progress(0)
-            for i in range(num_predictions):
-                f1 = random.uniform(-2, 2)
-                f2 = random.uniform(-2, 2)
+            features_list = [
+                [random.uniform(-2, 2), random.uniform(-2, 2)]
+                for _ in range(num_predictions)
+            ]
 
-                success, result = st.session_state.api_client.predict([f1, f2])
-                if success:
+            # Un seul appel API pour tout le lot
+            with st.spinner("Prédictions en cours..."):
+                success, result = st.session_state.api_client.predict_batch(
+                    features_list
+                )
+
+            if success:
+                for (f1, f2), prediction in zip(
+                    features_list, result["predictions"], strict=True
+                ):
                     predictions_data.append(
                         {
                             "Feature1": f1,
                             "Feature2": f2,
-                            "Prediction": result["prediction"],
-                            "Confidence": result["confidence"],
+                            "Prediction": prediction["prediction"],
+                            "Confidence": prediction["confidence"],
                         }
                     )
-
-                progress_bar.progress((i + 1) / num_predictions)
+            else:
+                st.error(f"❌ Erreur de prédiction: {result}")
 
             if predictions_data:
                 df = pd.DataFrame(predictions_data)
@@ -389,6 +433,15 @@ def dataset_management():
                 st.warning("Aucun dataset trouvé")
 
 
+def probe_service_status(session, url):
+    """Code HTTP d'un service, ou None s'il est injoignable"""
+    try:
+        with session.get(url, timeout=3, stream=True) as response:
+            return response.status_code
+    except requests.RequestException:
+        return None
+
+
 def monitoring_dashboard():
     """Dashboard de monitoring"""
     st.header("📈 Enterprise Monitoring Dashboard")
@@ -405,17 +458,24 @@ def monitoring_dashboard():
     }
 
     if st.button("🔄 Check Service Status"):
+        # Sondes en parallèle (3s max au total au lieu de 3s par service) ;
+        # l'affichage Streamlit et le cache de session restent dans le thread
+        # principal, les workers reçoivent la session déjà résolue
+        session = get_http_session()
+        with ThreadPoolExecutor(max_workers=len(services)) as executor:
+            status_codes = list(
+                executor.map(partial(probe_service_status, session), services.values())
+            )
+
         cols = st.columns(len(services))
-        for i, (name, url) in enumerate(services.items()):
-            with cols[i]:
-                try:
-                    response = requests.get(url, timeout=3)
-                    if response.status_code == 200:
-                        st.success(f"{name}\n✅ Online")
-                    else:
-                        st.error(f"{name}\n❌ Error {response.status_code}")
-                except Exception:
+        for col, name, status_code in zip(cols, services, status_codes, strict=True):
+            with col:
+                if status_code is None:
                     st.error(f"{name}\n❌ Offline")
+                elif status_code == 200:
+                    st.success(f"{name}\n✅ Online")
+                else:
+                    st.error(f"{name}\n❌ Error {status_code}")
 
     st.markdown("""
     ### 🔗 Enterprise Monitoring Services
@@ -160,6 +160,42 @@ class TestPredictionEndpoints:
             assert pred["prediction"] == first_prediction
             assert abs(pred["confidence"] - first_confidence) < 0.001  # Small tolerance
 
+    def test_predict_batch_endpoint_matches_single_predictions(self, auth_headers):
+        """Test that batch predictions match one-by-one predictions"""
+        batch = [[0.5, 0.5], [-1.0, 2.0], [1.5, -0.5]]
+
+        response = requests.post(
+            f"{API_BASE_URL}/predict/batch",
+            json={"features": batch},
+            headers=auth_headers,
+            timeout=10,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == len(batch)
+
+        for features, batch_pred in zip(batch, data["predictions"], strict=True):
+            single = requests.post(
+                f"{API_BASE_URL}/predict",
+                json={"features": features},
+                headers=auth_headers,
+                timeout=10,
+            ).json()
+            assert batch_pred["prediction"] == single["prediction"]
+            assert abs(batch_pred["confidence"] - single["confidence"]) < 0.001
+
+    def test_predict_batch_endpoint_with_wrong_number_of_features(self, auth_headers):
+        """Test batch prediction rejects vectors without exactly 2 features"""
+        response = requests.post(
+            f"{API_BASE_URL}/predict/batch",
+            json={"features": [[0.5, 0.5], [1.0]]},
+            headers=auth_headers,
+            timeout=10,
+        )
+
+        assert response.status_code == 422
+
     def test_generate_endpoint_requires_authentication(self, sample_generation_data):
         """Test that generate endpoint requires authentication"""
         response = requests.post(
@@ -4,6 +4,7 @@ Comprehensive test runner for IA Continu Solution
 Runs all tests and provides detailed reporting
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import subprocess
 import sys
@@ -22,6 +23,15 @@ SERVICES_TO_CHECK = [
 ]
 
 
+def probe_service(session, service_url):
+    """Probe a single service URL and return (status_code, error)"""
+    try:
+        response = session.get(service_url, timeout=5)
+        return response.status_code, None
+    except requests.exceptions.RequestException as e:
+        return None, e
+
+
 def check_service_availability():
     """Check if all required services are running"""
     print("🔍 Checking service availability...")
@@ -29,18 +39,28 @@ def check_service_availability():
     available_services = []
     unavailable_services = []
 
-    for service_name, service_url in SERVICES_TO_CHECK:
-        try:
-            response = requests.get(service_url, timeout=5)
-            if response.status_code in [200, 201, 302]:
+    # Probe all services concurrently over a shared session: total wait is
+    # bounded by the slowest service instead of the sum of all timeouts
+    with (
+        requests.Session() as session,
+        ThreadPoolExecutor(max_workers=len(SERVICES_TO_CHECK)) as executor,
+    ):
+        results = executor.map(
+            lambda service: probe_service(session, service[1]), SERVICES_TO_CHECK
+        )
+
+        for (service_name, _service_url), (status_code, error) in zip(
+            SERVICES_TO_CHECK, results, strict=True
+        ):
+            if status_code in [200, 201, 302]:
                 available_services.append(service_name)
                 print(f"  ✅ {service_name}: Available")
+            elif error is None:
+                unavailable_services.append(service_name)
+                print(f"  ❌ {service_name}: HTTP {status_code}")
             else:
                 unavailable_services.append(service_name)
-                print(f"  ❌ {service_name}: HTTP {response.status_code}")
-        except requests.exceptions.RequestException as e:
-            unavailable_services.append(service_name)
-            print(f"  ❌ {service_name}: Connection failed - {e}")
+                print(f"  ❌ {service_name}: Connection failed - {error}")
 
     print(
         f"\n📊 Service Status: {len(available_services)}/{len(SERVICES_TO_CHECK)} available"
@@ -54,6 +74,25 @@ def check_service_availability():
     return True
 
 
+def wait_for_api_ready(timeout=5.0):
+    """Poll the API health endpoint until it returns 200 or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+
+    while True:
+        try:
+            if requests.get(f"{API_BASE_URL}/health", timeout=1).status_code == 200:
+                return True
+        except requests.exceptions.RequestException:
+            pass
+
+        if time.monotonic() + delay > deadline:
+            return False
+
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
 def run_test_category(category_path, category_name):
     """Run tests for a specific category"""
     print(f"\n🧪 Running {category_name} tests...")
@@ -98,9 +137,11 @@ def run_all_tests():
         print("\n❌ Cannot run tests - services not available")
         return False
 
-    # Wait a moment for services to stabilize
+    # Wait until the API answers its health check (instead of a fixed delay)
     print("\n⏳ Waiting for services to stabilize...")
-    time.sleep(5)
+    if not wait_for_api_ready():
+        print("\n❌ Cannot run tests - API health check not passing")
+        return False
 
     # Test categories to run
     test_categories = [